@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hmac
+
+from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 from app.models.community_message import CommunityMessage
@@ -51,6 +54,12 @@ def get_current_user_optional(token: str = Depends(oauth2_scheme_optional), db:
     except JWTError:
         return None
 
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin endpoints are disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
+
 from app.services.two_fa_service import two_fa_service
 
 class UserCreate(BaseModel):
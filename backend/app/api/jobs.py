@@ -6,6 +6,8 @@ from app.api.auth import get_current_user
 from app.models.user import User
 from app.models.roadmap import Roadmap
 from app.services.job_service import job_service
+from app.logic.roadmap_engine import roadmap_engine
+from app.logic.roadmap_format import expand_roadmap
 
 router = APIRouter()
 
@@ -30,10 +32,10 @@ def get_job_matches(current_user: User = Depends(get_current_user), db: Session
     career_path = roadmap.career_path
     
     # Calculate current phase based on roadmap content
-    # If content has 'roadmap' key which is a list of phases
+    # Content is either the legacy list of phases or the compact v2 payload
     current_phase = 1
-    if roadmap.content and isinstance(roadmap.content.get('roadmap'), list):
-        phases = roadmap.content['roadmap']
+    if roadmap.content:
+        phases = expand_roadmap(roadmap.content, roadmap_engine.SKILL_DETAILS)
         # Find the highest phase number that has some progress or is completed
         # For simplicity in this mock, we'll check how many phases have completed steps
         completed_phases = 0
@@ -1,61 +1,74 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+import io
+import os
+import sqlite3
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.database import get_db
-from app.api.auth import get_current_user, get_current_user_optional
+from app.api.auth import get_current_user, get_current_user_optional, require_admin
 from app.models.user import User
 from app.models.roadmap import Roadmap
 from typing import Optional, List, Any
-from fastapi.responses import JSONResponse
-from app.models.api_schemas import CareerInput, CareerPredictionResponse, SkillGapResponse
-from app.services.ml_service import career_predictor
-from app.services.resume_parser import resume_parser
-from app.logic.roadmap_engine import roadmap_engine
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.core import metrics
+from app.models.api_schemas import BatchPredictionResponse, CareerInput, CareerPredictionResponse, SkillGapResponse
+from app.services.ml_service import ModelUnavailableError, career_predictor
+from app.services.extraction_pool import ExtractionBusyError, ExtractionTimeoutError, extraction_pool
+from app.services.resume_cache import parser_version, resume_cache
+from app.services.resume_parser import ResumeTooLargeError, resume_parser
+from app.services.resume_upload import UploadTooLargeError, spool_upload
+from app.services.cohort_service import count_csv_rows, read_csv_rows, run_cohort, cohort_pool, to_ndjson
+from app.services.roadmap_history import RoadmapConflictError, save_roadmap, list_versions, reconstruct
+from app.logic.roadmap_engine import roadmap_engine, scores_from_profile
+from app.logic.roadmap_format import compact_roadmap, expand_roadmap
+from app.logic.skill_taxonomy import skill_taxonomy
 
 router = APIRouter()
 
+def _format_roadmap(content: Any, roadmap_format: str):
+    """Serve the compact v2 payload on request, the legacy phase list otherwise."""
+    if roadmap_format == "v2":
+        return compact_roadmap(content)
+    return expand_roadmap(content, roadmap_engine.SKILL_DETAILS)
+
 @router.post("/predict-career", response_model=CareerPredictionResponse)
-def predict_career(input_data: CareerInput, current_user: Optional[User] = Depends(get_current_user_optional), db: Session = Depends(get_db)):
-    try:
+def predict_career(input_data: CareerInput, roadmap_format: str = Query("v1", alias="format"), current_user: Optional[User] = Depends(get_current_user_optional), db: Session = Depends(get_db)):
+    with metrics.stage("features"):
+        try:
 
-        if hasattr(input_data, "model_dump"):
-            input_dict = input_data.model_dump()
-        elif hasattr(input_data, "dict"):
-            input_dict = input_data.dict()
-        else:
-            input_dict = dict(input_data)
-    except:
-        input_dict = {}
+            if hasattr(input_data, "model_dump"):
+                input_dict = input_data.model_dump()
+            elif hasattr(input_data, "dict"):
+                input_dict = input_data.dict()
+            else:
+                input_dict = dict(input_data)
+        except:
+            input_dict = {}
+
+        scores_dict = scores_from_profile(dict(input_data))
         
     result = career_predictor.predict(input_dict)
     predicted_career = result.get("predicted_career", "General Analyst")
-    
-    scores_dict = {
-        "programming": input_data.programming_score,
-        "math": input_data.math_score,
-        "communication": input_data.communication_score,
-        "logic": input_data.problem_solving_score,
-        "design": input_data.interest_design * 10
-    }
+    metrics.label(model_version=result.get("model_version"), career=predicted_career)
     
     confidence_score = result.get("confidence", 0.85)
     roadmap = roadmap_engine.generate(predicted_career, scores_dict, [], confidence=confidence_score)
     
     if current_user:
-        current_user.predicted_career = predicted_career
-        
-        # Save Roadmap to DB
-        existing_roadmap = db.query(Roadmap).filter(Roadmap.user_id == current_user.id, Roadmap.status == "active").first()
-        if existing_roadmap:
-            existing_roadmap.status = "archived"
+        with metrics.stage("db"):
+            current_user.predicted_career = predicted_career
             
-        new_roadmap = Roadmap(
-            user_id=current_user.id,
-            career_path=predicted_career,
-            content=roadmap,
-            status="active"
-        )
-        db.add(new_roadmap)
-        db.commit()
+            # Save Roadmap to DB (same career -> stored as a diff against the active one)
+            try:
+                save_roadmap(db, current_user.id, predicted_career, compact_roadmap(roadmap))
+            except RoadmapConflictError as e:
+                # Concurrent predictions for this user kept saving over each other;
+                # theirs is on record, so skip this revision and still answer
+                print(f"Roadmap not saved: {e}")
+            db.commit()
     
     career_match = confidence_score * 100
     # ... (rest of response preparation) ...
@@ -110,62 +123,208 @@ def predict_career(input_data: CareerInput, current_user: Optional[User] = Depen
     # Determine missing skills based on career
     missing_skills = roadmap_engine.CAREER_REQUIRED_SKILLS.get(predicted_career, ["Python", "Algorithms", "Databases", "Cloud", "Testing"])
 
+    with metrics.stage("response"):
+        payload = {
+            "predicted_career": predicted_career,
+            "confidence": confidence_score,
+            "probabilities": result.get("probabilities", []),
+            "extracted_skills": extracted_skills, 
+            "missing_skills": missing_skills, 
+            "recommended_roadmap": _format_roadmap(roadmap, roadmap_format),
+            "radar_data": radar_data,
+            "career_match_score": career_match,
+            "next_recommended_skill": next_recommended_skill,
+            "probability_chart_data": probability_chart_data,
+            "skill_comparison_data": skill_comparison_data,
+            "featured_projects": roadmap_engine.get_projects_for_skills(predicted_career, missing_skills),
+            "skill_details": {s.lower(): roadmap_engine.SKILL_DETAILS.get(s.lower(), {}) for s in missing_skills + [sk["name"] for sk in extracted_skills]},
+            "catalog_hash": roadmap_engine.catalog_hash,
+            "model_version": result.get("model_version")
+        }
+        # Validated and encoded here rather than by FastAPI, so the cost is timed as its own stage
+        return JSONResponse(content=jsonable_encoder(CareerPredictionResponse(**payload)))
+
+@router.post("/predict-career/batch", response_model=BatchPredictionResponse)
+def predict_career_batch(rows: List[CareerInput]):
+    """
+    Career predictions for many students in one call (e.g. what-if runs for a
+    whole class). Results are in input order; no roadmaps are generated or saved.
+    """
+    if len(rows) > settings.MAX_BATCH_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {settings.MAX_BATCH_ROWS} rows per batch")
+    with metrics.stage("inference"):
+        results = career_predictor.predict_batch([dict(row) for row in rows])
+    if results:
+        metrics.label(model_version=results[0].get("model_version"))
+    return {"count": len(results), "results": results}
+
+def _csv_text(upload) -> io.TextIOWrapper:
+    upload.seek(0)
+    return io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+
+@router.post("/predict-career/cohort", dependencies=[Depends(require_admin)])
+def predict_cohort(file: UploadFile = File(...), workers: Optional[int] = Query(None, ge=1, le=os.cpu_count() or 1)):
+    """
+    Predict careers and compact roadmaps for a CSV of CareerInput rows.
+    Streams one NDJSON object per row, in input order; each carries its 1-based
+    "row" number, and X-Cohort-Rows gives the total for progress reporting.
+    Runs on the server's shared cohort pool (one process per core); `workers`
+    limits this upload to two chunks in flight per worker.
+    """
+    # Two passes over the spooled upload (count, then predict) instead of holding it all decoded
+    counting = _csv_text(file.file)
+    total = count_csv_rows(counting)
+    counting.detach()
+    results = run_cohort(read_csv_rows(_csv_text(file.file)), workers=workers, total=total, pool=cohort_pool)
+    return StreamingResponse(to_ndjson(results), media_type="application/x-ndjson", headers={"X-Cohort-Rows": str(total)})
+
+@router.get("/catalog")
+def get_catalog_version():
+    return {"content_hash": roadmap_engine.catalog_hash}
+
+@router.get("/catalog/skill-details")
+def get_catalog_skill_details(if_none_match: Optional[str] = Header(None)):
+    """Shared skill metadata, cacheable by catalog hash (ETag / If-None-Match)."""
+    etag = f'"{roadmap_engine.catalog_hash}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=0, must-revalidate"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=roadmap_engine.SKILL_DETAILS, headers=headers)
+
+@router.post("/admin/catalog/reload", dependencies=[Depends(require_admin)])
+def reload_catalog():
+    """Swap in the current roadmap catalog without a restart; in-flight requests are unaffected."""
+    try:
+        return roadmap_engine.reload_catalog()
+    except (sqlite3.Error, OSError, KeyError) as e:
+        raise HTTPException(status_code=500, detail=f"Catalog reload failed, keeping {roadmap_engine.catalog_hash[:12]}: {e}")
+
+@router.get("/admin/models", dependencies=[Depends(require_admin)])
+def list_models():
+    """Registered career model versions with their metadata; `active` marks the one being served."""
+    return {"active": career_predictor.model_version, "models": career_predictor.list_models()}
+
+@router.post("/admin/models/{version}/activate", dependencies=[Depends(require_admin)])
+def activate_model(version: str):
+    """
+    Load a registered model version and swap it in atomically. Predictions
+    already running finish on the previous version; other workers follow.
+    """
+    try:
+        return career_predictor.activate(version)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown model version {version}")
+    except (ModelUnavailableError, OSError) as e:
+        raise HTTPException(status_code=500, detail=f"Model swap failed, keeping the current version: {e}")
+
+@router.get("/admin/stats", dependencies=[Depends(require_admin)])
+def get_cache_stats():
+    """Hit rates of the roadmap cache, the prediction memo / lookup table and the resume extraction cache."""
+    return {"roadmap_cache": roadmap_engine.cache_stats(), "predictions": career_predictor.cache_stats(), "resume_cache": resume_cache.stats()}
+
+@router.get("/admin/metrics", dependencies=[Depends(require_admin)])
+def get_stage_metrics(route: Optional[str] = None, stage: Optional[str] = None, model_version: Optional[str] = None, career: Optional[str] = None):
+    """
+    Per-stage latency histograms (ms) labelled by route, stage, model version
+    and career; each query parameter filters on an exact label value.
+    """
     return {
-        "predicted_career": predicted_career,
-        "confidence": result.get("probabilities")[0].get("prob") / 100 if result.get("probabilities") else 0.8,
-        "probabilities": result.get("probabilities", []),
-        "extracted_skills": extracted_skills, 
-        "missing_skills": missing_skills, 
-        "recommended_roadmap": roadmap,
-        "radar_data": radar_data,
-        "career_match_score": career_match,
-        "next_recommended_skill": next_recommended_skill,
-        "probability_chart_data": probability_chart_data,
-        "skill_comparison_data": skill_comparison_data,
-        "featured_projects": roadmap_engine.get_projects_for_skills(predicted_career, missing_skills),
-        "skill_details": {s.lower(): roadmap_engine.SKILL_DETAILS.get(s.lower(), {}) for s in missing_skills + [sk["name"] for sk in extracted_skills]}
+        "buckets_ms": list(metrics.BUCKETS_MS),
+        "histograms": metrics.stage_metrics.snapshot(route=route, stage=stage, model_version=model_version, career=career),
+        # Resume extraction workers: saturation, queue depth, queue wait / run time, outcomes
+        "extraction_pool": extraction_pool.stats(),
     }
 
 @router.get("/get-roadmap")
-def get_user_roadmap(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_user_roadmap(roadmap_format: str = Query("v1", alias="format"), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     active_roadmap = db.query(Roadmap).filter(Roadmap.user_id == current_user.id, Roadmap.status == "active").first()
     
     if not active_roadmap:
         return {"roadmap": [], "career": None}
         
     return {
-        "roadmap": active_roadmap.content,
+        "roadmap": _format_roadmap(active_roadmap.content, roadmap_format),
+        "career": active_roadmap.career_path,
+        "created_at": active_roadmap.created_at,
+        "catalog_hash": roadmap_engine.catalog_hash
+    }
+
+@router.get("/roadmap/history")
+def get_roadmap_history(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    active_roadmap = db.query(Roadmap).filter(Roadmap.user_id == current_user.id, Roadmap.status == "active").first()
+    if not active_roadmap:
+        return {"career": None, "versions": []}
+
+    return {
+        "career": active_roadmap.career_path,
+        "versions": list_versions(db, active_roadmap)
+    }
+
+@router.get("/roadmap/history/{version}")
+def get_roadmap_version(version: int, roadmap_format: str = Query("v1", alias="format"), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    active_roadmap = db.query(Roadmap).filter(Roadmap.user_id == current_user.id, Roadmap.status == "active").first()
+    content = reconstruct(db, active_roadmap, version) if active_roadmap else None
+    if content is None:
+        raise HTTPException(status_code=404, detail="Roadmap version not found")
+
+    return {
+        "version": version,
+        "roadmap": _format_roadmap(content, roadmap_format),
         "career": active_roadmap.career_path,
-        "created_at": active_roadmap.created_at
+        "catalog_hash": roadmap_engine.catalog_hash
     }
 
 # ... (rest of routes) ...
 
 @router.post("/analyze-resume", response_model=SkillGapResponse)
-async def analyze_resume(file: UploadFile = File(...), current_user: Optional[User] = Depends(get_current_user_optional), db: Session = Depends(get_db)):
-    contents = await file.read()
+async def analyze_resume(file: UploadFile = File(...), roadmap_format: str = Query("v1", alias="format"), current_user: Optional[User] = Depends(get_current_user_optional), db: Session = Depends(get_db)):
+    try:
+        upload = await spool_upload(file)
+    except UploadTooLargeError as e:
+        return JSONResponse(status_code=413, content={"success": False, "message": str(e)})
     text = ""
     try:
         filename = file.filename.lower()
-        if filename.endswith('.pdf'):
-            text = resume_parser.extract_text_from_pdf(contents)
-        elif filename.endswith('.docx'):
-            text = resume_parser.extract_text_from_docx(contents)
+        kind = "pdf" if filename.endswith('.pdf') else "docx" if filename.endswith('.docx') else None
+        if kind:
+            # Same bytes, same parser and taxonomy: reuse the earlier result
+            cache_key = (upload.sha256, kind, parser_version(), resume_parser.taxonomy.version)
+            with metrics.stage("cache"):
+                cached = await run_in_threadpool(resume_cache.get, *cache_key)
+            if cached is not None:
+                text, extracted_skills = cached
+            else:
+                # Parsed in a worker process so a large document cannot stall the event loop;
+                # skills are matched page by page as the worker reads
+                with metrics.stage("extract"):
+                    text, extracted_skills = await run_in_threadpool(extraction_pool.extract, kind, upload.source)
+                if text:
+                    with metrics.stage("cache"):
+                        await run_in_threadpool(resume_cache.put, *cache_key, text, extracted_skills)
         else:
-            text = contents.decode("utf-8")
+            text = upload.read().decode("utf-8")
+            extracted_skills = resume_parser.extract_skills(text)
+    except ResumeTooLargeError as e:
+        return JSONResponse(status_code=413, content={"success": False, "message": str(e)})
+    except ExtractionTimeoutError:
+        return JSONResponse(status_code=422, content={"success": False, "message": "Resume took too long to process"})
+    except ExtractionBusyError:
+        return JSONResponse(status_code=503, content={"success": False, "message": "Resume processing is busy, try again shortly"})
     except:
         return JSONResponse(status_code=400, content={"success": False, "message": "Extraction failed"})
+    finally:
+        upload.close()
 
     if not text:
          return JSONResponse(status_code=400, content={"success": False, "message": "No text detected"})
 
-    extracted_skills = resume_parser.extract_skills(text)
     target_career = "Software Engineer"
     existing_skill_names = [s["name"].lower() for s in extracted_skills]
     
-    if any(s in ["design", "figma", "ui", "ux"] for s in existing_skill_names):
+    career_hints = skill_taxonomy.careers(existing_skill_names)
+    if "UI/UX Designer" in career_hints:
         target_career = "UI/UX Designer"
-    elif any(s in ["data", "ml", "python", "sql"] for s in existing_skill_names):
+    elif "Data Scientist" in career_hints:
         target_career = "Data Scientist"
     
     roadmap = roadmap_engine.generate(target_career, {"programming": 60, "soft skills": 80}, existing_skill_names)
@@ -204,19 +363,20 @@ async def analyze_resume(file: UploadFile = File(...), current_user: Optional[Us
     next_recommended_skill = roadmap[0]["steps"][0]["skill"] if roadmap and roadmap[0]["steps"] else "Advanced Python"
 
     # Determine missing skills based on target career
-    missing_skills = [s for s in roadmap_engine.CAREER_REQUIRED_SKILLS.get(target_career, []) if s.lower() not in existing_skill_names]
+    missing_skills = [s for s in roadmap_engine.CAREER_REQUIRED_SKILLS.get(target_career, []) if (skill_taxonomy.canonical(s) or s).lower() not in existing_skill_names]
     if not missing_skills:
         missing_skills = ["Scaling", "DevOps", "Advanced Algorithms", "System Design"]
 
     return {
         "extracted_skills": extracted_skills,
         "missing_skills": missing_skills,
-        "recommended_roadmap": roadmap,
+        "recommended_roadmap": _format_roadmap(roadmap, roadmap_format),
         "radar_data": radar_data,
         "career_match_score": base_score,
         "next_recommended_skill": next_recommended_skill,
         "probability_chart_data": probability_chart_data,
         "skill_comparison_data": skill_comparison_data,
         "featured_projects": roadmap_engine.get_projects_for_skills(target_career, missing_skills),
-        "skill_details": {s.lower(): roadmap_engine.SKILL_DETAILS.get(s.lower(), {}) for s in missing_skills + [sk["name"] for sk in extracted_skills]}
+        "skill_details": {s.lower(): roadmap_engine.SKILL_DETAILS.get(s.lower(), {}) for s in missing_skills + [sk["name"] for sk in extracted_skills]},
+        "catalog_hash": roadmap_engine.catalog_hash
     }
@@ -0,0 +1,83 @@
+"""
+Request body size caps, enforced while the body streams in.
+
+Multipart forms are parsed before a route runs, so a route cannot stop an
+oversized upload itself. For the capped paths this middleware answers 413
+up front when Content-Length is over the limit, and otherwise counts body
+bytes as they arrive, cutting the request off as soon as it crosses the limit
+(chunked uploads have no Content-Length).
+
+Caps are given as the largest file a path accepts. The raw body also carries
+multipart framing (boundaries, part headers, small form fields), so up to
+MULTIPART_OVERHEAD bytes more are let through; the route enforces the exact
+file size itself (see `spool_upload`).
+"""
+import json
+from typing import Any, Callable, Dict
+
+from starlette.datastructures import Headers
+
+
+class BodyTooLargeError(Exception):
+    pass
+
+
+class BodySizeLimit:
+    """ASGI middleware; `limits` maps exact request paths to their file size cap in bytes."""
+
+    MULTIPART_OVERHEAD = 4 * 1024
+
+    def __init__(self, app: Callable, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    @staticmethod
+    async def _reject(send: Callable, limit: int) -> None:
+        body = json.dumps({"success": False, "message": f"Upload is larger than {limit} bytes"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        file_limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if file_limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        limit = file_limit + self.MULTIPART_OVERHEAD
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > limit:
+            await self._reject(send, file_limit)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive() -> Dict[str, Any]:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise BodyTooLargeError()
+            return message
+
+        async def guarded_send(message: Dict[str, Any]) -> None:
+            nonlocal started
+            # Once the body is cut off, whatever error the app reports is replaced by the 413
+            if exceeded:
+                return
+            started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except BodyTooLargeError:
+            pass
+        if exceeded and not started:
+            await self._reject(send, file_limit)
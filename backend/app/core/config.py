@@ -8,4 +8,55 @@ class Settings:
     _BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     DATABASE_URL: str = f"sqlite:///{os.path.join(_BASE_DIR, 'careersense.db')}"
 
+    # Shared secret for operator endpoints (X-Admin-Token); empty disables them
+    ADMIN_TOKEN: str = os.getenv("CAREERSENSE_ADMIN_TOKEN", "")
+
+    # Upper bound on rows accepted by /api/predict-career/batch
+    MAX_BATCH_ROWS: int = int(os.getenv("CAREERSENSE_MAX_BATCH_ROWS", "10000"))
+
+    # Exact-input LRU memo in front of CareerPredictor.predict (0 disables it)
+    PREDICTION_MEMO_SIZE: int = int(os.getenv("CAREERSENSE_PREDICTION_MEMO_SIZE", "4096"))
+
+    # Micro-batching of concurrent live predictions: a batch closes at this many
+    # rows or this many ms after its first row (PREDICTION_MAX_BATCH=1 disables it)
+    PREDICTION_MAX_BATCH: int = int(os.getenv("CAREERSENSE_PREDICTION_MAX_BATCH", "64"))
+    PREDICTION_MAX_WAIT_MS: float = float(os.getenv("CAREERSENSE_PREDICTION_MAX_WAIT_MS", "2"))
+
+    # Versioned career models (see app/services/model_registry.py). Workers
+    # re-check which version is active at most this often (0 disables it)
+    MODEL_REGISTRY_DIR: str = os.getenv("CAREERSENSE_MODEL_REGISTRY", os.path.join(_BASE_DIR, "app", "models_data", "registry"))
+    MODEL_POLL_SECONDS: float = float(os.getenv("CAREERSENSE_MODEL_POLL_SECONDS", "5"))
+
+    # Echo per-stage request timings in a Server-Timing response header
+    SERVER_TIMING: bool = os.getenv("CAREERSENSE_SERVER_TIMING", "0").lower() in ("1", "true", "yes")
+
+    # Canonical skills and aliases shared by resume parsing, roadmaps and job matching
+    SKILL_TAXONOMY_PATH: str = os.getenv("CAREERSENSE_SKILL_TAXONOMY", os.path.join(_BASE_DIR, "app", "models_data", "skill_taxonomy.json"))
+
+    # Resume text extraction runs in this many worker processes (0 runs it in a
+    # thread of the API process, without timeouts). Jobs are killed after
+    # RESUME_EXTRACTION_TIMEOUT seconds; past RESUME_EXTRACTION_QUEUE waiting jobs
+    # new uploads are turned away.
+    RESUME_EXTRACTION_WORKERS: int = int(os.getenv("CAREERSENSE_RESUME_EXTRACTION_WORKERS", "2"))
+    RESUME_EXTRACTION_TIMEOUT: float = float(os.getenv("CAREERSENSE_RESUME_EXTRACTION_TIMEOUT", "10"))
+    RESUME_EXTRACTION_QUEUE: int = int(os.getenv("CAREERSENSE_RESUME_EXTRACTION_QUEUE", "16"))
+    # Uploads over RESUME_MAX_UPLOAD_MB are cut off while they stream in; past
+    # RESUME_SPOOL_KB they are kept on disk rather than in memory
+    RESUME_MAX_UPLOAD_MB: float = float(os.getenv("CAREERSENSE_RESUME_MAX_UPLOAD_MB", "10"))
+    RESUME_SPOOL_KB: int = int(os.getenv("CAREERSENSE_RESUME_SPOOL_KB", "1024"))
+    # Reading stops after RESUME_MAX_PAGES pages, or once RESUME_SKILL_SATURATION
+    # distinct skills are found (0 reads on); documents expanding past
+    # RESUME_MAX_DECOMPRESSED_MB are rejected
+    RESUME_MAX_PAGES: int = int(os.getenv("CAREERSENSE_RESUME_MAX_PAGES", "20"))
+    RESUME_SKILL_SATURATION: int = int(os.getenv("CAREERSENSE_RESUME_SKILL_SATURATION", "30"))
+    RESUME_MAX_DECOMPRESSED_MB: float = float(os.getenv("CAREERSENSE_RESUME_MAX_DECOMPRESSED_MB", "50"))
+
+    # Extraction results of uploaded resumes, keyed by content hash; least recently
+    # used entries are evicted past RESUME_CACHE_MB of stored results (0 disables it)
+    RESUME_CACHE_PATH: str = os.getenv("CAREERSENSE_RESUME_CACHE", os.path.join(_BASE_DIR, "resume_cache.db"))
+    RESUME_CACHE_MB: float = float(os.getenv("CAREERSENSE_RESUME_CACHE_MB", "64"))
+
+    # Compiled roadmap catalog; can be replaced on disk and hot-reloaded (SIGHUP or /api/admin/catalog/reload)
+    ROADMAP_CATALOG_PATH: str = os.getenv("CAREERSENSE_ROADMAP_CATALOG", os.path.join(_BASE_DIR, "app", "models_data", "roadmap_catalog.db"))
+
 settings = Settings()
@@ -0,0 +1,175 @@
+"""
+Per-stage request latency.
+
+Code on a request path wraps its stages in `stage("name")`; services can do
+the same without knowing whether they run inside a request (outside one,
+`stage()` only costs a context-variable lookup). When the request finishes,
+its stage durations go into latency histograms labelled by route, stage,
+model version and career (`label()` sets the last two), and can be echoed
+back in a Server-Timing header. Time not covered by any stage (routing,
+request validation, dependencies, serialization) is recorded as "other".
+"""
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds (ms) of the histogram buckets; one more bucket catches the rest
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in milliseconds."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (the maximum for the last bucket)."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(BUCKETS_MS + ("+Inf",), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.quantile(0.5), 3),
+            "p95_ms": round(self.quantile(0.95), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+            # Cumulative counts per upper bound (ms), as in Prometheus "le" buckets
+            "buckets": buckets,
+        }
+
+
+LabelKey = Tuple[str, str, str, str]
+
+
+class StageMetrics:
+    """Histograms keyed by (route, stage, model_version, career)."""
+
+    LABELS = ("route", "stage", "model_version", "career")
+
+    def __init__(self):
+        self._histograms: Dict[LabelKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route: str, stages: Dict[str, float], labels: Dict[str, str]) -> None:
+        model_version, career = labels.get("model_version", ""), labels.get("career", "")
+        with self._lock:
+            for name, seconds in stages.items():
+                key = (route, name, model_version, career)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = LatencyHistogram()
+                histogram.observe(seconds * 1000)
+
+    def snapshot(self, **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """One entry per label set, optionally filtered by exact label values."""
+        wanted = [(self.LABELS.index(name), value) for name, value in filters.items() if value is not None]
+        with self._lock:
+            return [
+                dict(zip(self.LABELS, key), **histogram.snapshot())
+                for key, histogram in sorted(self._histograms.items())
+                if all(key[i] == value for i, value in wanted)
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+class RequestTimer:
+    """Stage durations and labels collected during one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.labels: Dict[str, str] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def finish(self) -> Dict[str, float]:
+        """All stages plus "other" and "total", in seconds."""
+        total = time.perf_counter() - self.started
+        stages = dict(self.stages)
+        stages["other"] = max(total - sum(self.stages.values()), 0.0)
+        stages["total"] = total
+        return stages
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """
+    Full path template of the route that served a request, e.g.
+    "/api/roadmap/history/{version}", so path parameters do not multiply label sets.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "unmatched"
+    path = scope.get("root_path", "") + scope["path"]
+    try:
+        concrete = route.path_format.format(**scope.get("path_params", {}))
+    except (AttributeError, KeyError, IndexError):
+        return route.path
+    # Router prefixes are not part of route.path; recover them from the request path
+    return path[:-len(concrete)] + route.path if concrete and path.endswith(concrete) else route.path
+
+
+def server_timing(stages: Dict[str, float]) -> str:
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in stages.items())
+
+
+_current: contextvars.ContextVar[Optional[RequestTimer]] = contextvars.ContextVar("request_timer", default=None)
+
+
+def start_request() -> RequestTimer:
+    """Start timing the current request; threads and tasks it spawns inherit the timer."""
+    timer = RequestTimer()
+    _current.set(timer)
+    return timer
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as stage `name` of the current request, if any."""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - started)
+
+
+def label(**labels: Optional[str]) -> None:
+    """Label the current request's histograms (model_version, career)."""
+    timer = _current.get()
+    if timer is not None:
+        timer.labels.update({name: value for name, value in labels.items() if value is not None})
+
+
+stage_metrics = StageMetrics()
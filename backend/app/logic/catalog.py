@@ -0,0 +1,221 @@
+"""
+Compiled roadmap catalog.
+
+`python -m app.logic.catalog build` compiles `catalog_source` into a read-only
+SQLite file holding one zlib-compressed JSON blob per (section, career).
+`RoadmapCatalog` opens that file and decodes a career's sections only when the
+career is first requested, so workers never evaluate or hold the whole
+knowledge base up front.
+"""
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Artifact compiled from the in-tree catalog_source; CATALOG_PATH may point elsewhere
+BUNDLED_CATALOG_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "models_data", "roadmap_catalog.db"))
+CATALOG_PATH = settings.ROADMAP_CATALOG_PATH
+SOURCE_PATH = os.path.join(os.path.dirname(__file__), "catalog_source.py")
+
+# Keyed by career and decoded per career on first access
+CAREER_SECTIONS = ("CAREER_REQUIRED_SKILLS", "TEMPLATES", "PROJECT_TEMPLATES", "MINDMAP_DATA", "PHASE_RESOURCES", "PHASE_OBJECTIVES")
+# Shared by every career and decoded whole on first access
+SHARED_SECTIONS = ("SKILL_DETAILS", "MODULE_RESOURCES", "TOOL_META", "PHASE_TOOLS")
+SECTIONS = CAREER_SECTIONS + SHARED_SECTIONS
+
+_SHARED_KEY = ""
+
+
+def _source_digest() -> Optional[str]:
+    try:
+        with open(SOURCE_PATH, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _encode(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+
+
+def _compile() -> Tuple[List[Tuple[str, str, int, bytes]], str]:
+    from app.logic import catalog_source
+
+    # Pick up edits made since the module was first imported (hot reload)
+    catalog_source = importlib.reload(catalog_source)
+
+    rows = []
+    for section in CAREER_SECTIONS:
+        for position, (career, value) in enumerate(getattr(catalog_source, section).items()):
+            rows.append((section, career, position, _encode(value)))
+    for section in SHARED_SECTIONS:
+        rows.append((section, _SHARED_KEY, 0, _encode(getattr(catalog_source, section))))
+
+    content_hash = hashlib.sha256()
+    for section, key, _, payload in rows:
+        content_hash.update(f"{section}\0{key}\0".encode("utf-8"))
+        content_hash.update(payload)
+    return rows, content_hash.hexdigest()
+
+
+def _write(conn: sqlite3.Connection, rows: List[Tuple[str, str, int, bytes]], content_hash: str) -> None:
+    conn.executescript("""
+        CREATE TABLE entries (section TEXT, key TEXT, position INTEGER, payload BLOB, PRIMARY KEY (section, key));
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+    """)
+    conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", rows)
+    conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+        ("content_hash", content_hash),
+        ("source_sha256", _source_digest() or ""),
+    ])
+    conn.commit()
+
+
+def build_catalog(path: str = BUNDLED_CATALOG_PATH) -> str:
+    """Compile catalog_source into `path` (replaced atomically) and return its content hash."""
+    rows, content_hash = _compile()
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        _write(conn, rows, content_hash)
+        conn.execute("VACUUM")
+        conn.close()
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return content_hash
+
+
+def build_catalog_in_memory() -> sqlite3.Connection:
+    """Compile catalog_source into a private in-memory database, for `RoadmapCatalog(conn=...)`."""
+    rows, content_hash = _compile()
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    _write(conn, rows, content_hash)
+    return conn
+
+
+class CareerSection(Mapping):
+    """Read-only career -> data mapping that decodes each career on first access."""
+
+    def __init__(self, catalog: "RoadmapCatalog", name: str, careers: List[str]):
+        self._catalog = catalog
+        self._name = name
+        self._careers = careers
+        self._career_set = frozenset(careers)
+        self._loaded: Dict[str, Any] = {}
+
+    def __getitem__(self, career: str) -> Any:
+        value = self._loaded.get(career)
+        if value is None:
+            if career not in self._career_set:
+                raise KeyError(career)
+            # Concurrent first loads race harmlessly; everyone keeps the first copy
+            value = self._loaded.setdefault(career, self._catalog._load(self._name, career))
+        return value
+
+    def __contains__(self, career: object) -> bool:
+        return career in self._career_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._careers)
+
+    def __len__(self) -> int:
+        return len(self._careers)
+
+
+class RoadmapCatalog:
+    """A compiled catalog file opened read-only; see module docstring."""
+
+    def __init__(self, path: str = CATALOG_PATH, conn: Optional[sqlite3.Connection] = None):
+        self.path = path
+        if conn is None:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._conn = conn
+        self._lock = threading.Lock()
+        self.meta: Dict[str, str] = dict(self._conn.execute("SELECT key, value FROM meta"))
+        self.content_hash = self.meta["content_hash"]
+
+        careers: Dict[str, List[str]] = {section: [] for section in CAREER_SECTIONS}
+        for section, key in self._conn.execute("SELECT section, key FROM entries ORDER BY section, position"):
+            if section in careers:
+                careers[section].append(key)
+        self._career_sections = {section: CareerSection(self, section, keys) for section, keys in careers.items()}
+        self._shared: Dict[str, Any] = {}
+
+    def _load(self, section: str, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM entries WHERE section = ? AND key = ?", (section, key)).fetchone()
+        return json.loads(zlib.decompress(row[0]))
+
+    def section(self, name: str) -> Any:
+        """Lazy CareerSection for per-career sections, plain dict for shared ones."""
+        if name in self._career_sections:
+            return self._career_sections[name]
+        value = self._shared.get(name)
+        if value is None:
+            if name not in SHARED_SECTIONS:
+                raise KeyError(name)
+            value = self._shared.setdefault(name, self._load(name, _SHARED_KEY))
+        return value
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _is_stale(path: str) -> bool:
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            built_from = dict(conn.execute("SELECT key, value FROM meta")).get("source_sha256")
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return True
+    digest = _source_digest()
+    # Deployments may ship the artifact without the source module
+    return digest is not None and digest != built_from
+
+
+def load_catalog(path: str = CATALOG_PATH) -> RoadmapCatalog:
+    """
+    Open a compiled catalog. If the bundled one is missing or older than
+    catalog_source, the source is compiled in memory instead; nothing is written
+    at runtime, so run `python -m app.logic.catalog build` to refresh the file.
+    Catalogs published elsewhere are opened as-is.
+    """
+    if os.path.abspath(path) == BUNDLED_CATALOG_PATH and (not os.path.exists(path) or _is_stale(path)):
+        print(f"Roadmap catalog {path} is missing or older than catalog_source; compiling it in memory (run `python -m app.logic.catalog build`)")
+        return RoadmapCatalog(path, conn=build_catalog_in_memory())
+    return RoadmapCatalog(path)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile the roadmap catalog.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--output", default=BUNDLED_CATALOG_PATH)
+    args = parser.parse_args(argv)
+
+    content_hash = build_catalog(args.output)
+    print(f"Catalog written to {args.output} ({os.path.getsize(args.output)} bytes, content hash {content_hash[:12]})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import copy
+from typing import Any, Dict, List
+
+# Structural diff between two JSON documents, expressed as an RFC 6902 subset
+# (add / remove / replace with JSON Pointer paths). Dicts are compared key by
+# key and lists index by index, so a regenerated roadmap that only changes a
+# few step statuses yields a patch touching just those fields.
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """Return the operations that turn `old` into `new`."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list):
+        ops = []
+        common = min(len(old), len(new))
+        for i in range(common):
+            ops.extend(diff(old[i], new[i], f"{path}/{i}"))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        # Remove from the end so earlier indices stay valid
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+        return ops
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply operations produced by `diff` to a copy of `document`."""
+    document = copy.deepcopy(document)
+    for op in ops:
+        if op["path"] == "":
+            document = copy.deepcopy(op["value"])
+            continue
+
+        *parents, last = [_unescape(t) for t in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        if isinstance(target, list):
+            index = int(last)
+            if op["op"] == "add":
+                target.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = copy.deepcopy(op["value"])
+        else:
+            if op["op"] == "remove":
+                del target[last]
+            else:
+                target[last] = copy.deepcopy(op["value"])
+    return document
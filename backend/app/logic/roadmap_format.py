@@ -0,0 +1,103 @@
+from typing import List, Dict, Any, Union
+
+# Version 1 is the plain list of phases produced by RoadmapEngine.generate.
+# Version 2 hoists the heavy catalog entries into a shared dictionary section:
+#
+#   {
+#     "format_version": 2,
+#     "dictionary": {"skill_details": {...}, "module_resources": {...}, "projects": {...}},
+#     "phases": [{..., "featured_project_refs": [...], "steps": [{..., "skill_ref", "resources_ref", "project_ref"}]}]
+#   }
+#
+# The phase-level "skill_details" field of version 1 is the entire SKILL_DETAILS
+# catalog table, so version 2 drops it and expand_roadmap re-attaches it.
+ROADMAP_FORMAT_VERSION = 2
+
+# step field -> (dictionary section, reference field)
+_STEP_REFS = {
+    "skill_details": ("skill_details", "skill_ref"),
+    "module_resources": ("module_resources", "resources_ref"),
+    "featured_project": ("projects", "project_ref"),
+}
+
+
+def is_compact(content: Any) -> bool:
+    return isinstance(content, dict) and content.get("format_version") == ROADMAP_FORMAT_VERSION
+
+
+def _intern(section: Dict[str, Any], key: str, value: Any) -> bool:
+    """Store value under key unless a different value already owns it."""
+    existing = section.get(key)
+    if existing is None:
+        section[key] = value
+        return True
+    return existing is value or existing == value
+
+
+def compact_roadmap(roadmap: Union[List[dict], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a version 1 roadmap into the normalized version 2 payload.
+    Already-compact payloads are returned unchanged.
+    """
+    if is_compact(roadmap):
+        return roadmap
+
+    dictionary: Dict[str, Dict[str, Any]] = {"skill_details": {}, "module_resources": {}, "projects": {}}
+    phases = []
+    for phase in roadmap or []:
+        compact_phase = {k: v for k, v in phase.items() if k not in ("steps", "skill_details", "featured_projects")}
+
+        projects = phase.get("featured_projects")
+        if projects is not None:
+            if all(_intern(dictionary["projects"], p["title"], p) for p in projects):
+                compact_phase["featured_project_refs"] = [p["title"] for p in projects]
+            else:
+                compact_phase["featured_projects"] = projects
+
+        steps = []
+        for step in phase.get("steps", []):
+            compact_step = dict(step)
+            for field, (section, ref_field) in _STEP_REFS.items():
+                value = step.get(field)
+                if not value:
+                    continue
+                key = value["title"] if section == "projects" else step["skill"].lower()
+                if _intern(dictionary[section], key, value):
+                    del compact_step[field]
+                    compact_step[ref_field] = key
+            steps.append(compact_step)
+        compact_phase["steps"] = steps
+        phases.append(compact_phase)
+
+    return {"format_version": ROADMAP_FORMAT_VERSION, "dictionary": dictionary, "phases": phases}
+
+
+def expand_roadmap(content: Any, skill_details: Dict[str, Any]) -> List[dict]:
+    """
+    Rebuild the version 1 list of phases for older clients.
+    `skill_details` is the catalog table re-attached to every phase.
+    Version 1 content (stored before the compact format existed) passes through.
+    """
+    if not is_compact(content):
+        return content or []
+
+    dictionary = content["dictionary"]
+    roadmap = []
+    for phase in content["phases"]:
+        expanded_phase = {k: v for k, v in phase.items() if k not in ("featured_project_refs", "steps")}
+
+        steps = []
+        for step in phase["steps"]:
+            expanded_step = dict(step)
+            for field, (section, ref_field) in _STEP_REFS.items():
+                if ref_field in expanded_step:
+                    expanded_step[field] = dictionary[section][expanded_step.pop(ref_field)]
+            steps.append(expanded_step)
+        expanded_phase["steps"] = steps
+
+        if "featured_project_refs" in phase:
+            expanded_phase["featured_projects"] = [dictionary["projects"][ref] for ref in phase["featured_project_refs"]]
+        expanded_phase["skill_details"] = skill_details
+        roadmap.append(expanded_phase)
+
+    return roadmap
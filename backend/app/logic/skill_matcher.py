@@ -0,0 +1,231 @@
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+
+class SubstringIndex:
+    """
+    Generalized suffix automaton over a fixed set of documents.
+
+    `query(pattern)` returns a bitmask of the documents that contain `pattern`
+    as a substring, in O(len(pattern)) regardless of how many documents exist.
+    """
+
+    def __init__(self, documents: Iterable[str] = ()):
+        self._next: List[Dict[str, int]] = [{}]
+        self._link: List[int] = [-1]
+        self._len: List[int] = [0]
+        self._mask: List[int] = [0]
+        self._size = 0
+        for doc in documents:
+            self.add(doc)
+        self.build()
+
+    def _new_state(self, length: int, link: int = -1, transitions: Dict[str, int] = None) -> int:
+        self._next.append(dict(transitions) if transitions else {})
+        self._link.append(link)
+        self._len.append(length)
+        self._mask.append(0)
+        return len(self._len) - 1
+
+    def _clone(self, p: int, q: int, c: str) -> int:
+        clone = self._new_state(self._len[p] + 1, self._link[q], self._next[q])
+        while p != -1 and self._next[p].get(c) == q:
+            self._next[p][c] = clone
+            p = self._link[p]
+        self._link[q] = clone
+        return clone
+
+    def _extend(self, last: int, c: str) -> int:
+        q = self._next[last].get(c)
+        if q is not None:
+            # Prefix already present from an earlier document
+            if self._len[last] + 1 == self._len[q]:
+                return q
+            return self._clone(last, q, c)
+
+        cur = self._new_state(self._len[last] + 1)
+        p = last
+        while p != -1 and c not in self._next[p]:
+            self._next[p][c] = cur
+            p = self._link[p]
+        if p == -1:
+            self._link[cur] = 0
+        else:
+            q = self._next[p][c]
+            if self._len[p] + 1 == self._len[q]:
+                self._link[cur] = q
+            else:
+                self._link[cur] = self._clone(p, q, c)
+        return cur
+
+    def add(self, document: str) -> int:
+        """Index a document and return its position in the result bitmasks."""
+        doc_id = self._size
+        self._size += 1
+        bit = 1 << doc_id
+        last = 0
+        for c in document:
+            last = self._extend(last, c)
+            self._mask[last] |= bit
+        self._mask[0] |= bit
+        return doc_id
+
+    def build(self) -> None:
+        # Every state's substrings also occur wherever its longer extensions end,
+        # so push masks up the suffix-link tree from the longest states down.
+        for state in sorted(range(1, len(self._len)), key=self._len.__getitem__, reverse=True):
+            self._mask[self._link[state]] |= self._mask[state]
+
+    def query(self, pattern: str) -> int:
+        state = 0
+        for c in pattern:
+            state = self._next[state].get(c)
+            if state is None:
+                return 0
+        return self._mask[state]
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher: `finditer(text)` reports every occurrence of every
+    added pattern in a single left-to-right pass over `text`. Patterns and text
+    are sequences of hashable symbols: characters, or word tokens.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[Sequence[Hashable], Any]] = ()):
+        self._goto: List[Dict[Hashable, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]
+        # Nearest proper suffix state that ends a pattern, to walk outputs lazily
+        self._dict_link: List[int] = [-1]
+        for pattern, value in patterns:
+            self.add(pattern, value)
+        self.build()
+
+    def add(self, pattern: Sequence[Hashable], value: Any) -> None:
+        state = 0
+        for c in pattern:
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][c] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._dict_link.append(-1)
+            state = nxt
+        self._out[state].append((len(pattern), value))
+
+    def build(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for c, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(c, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fail_state = self._fail[nxt]
+                self._dict_link[nxt] = fail_state if self._out[fail_state] else self._dict_link[fail_state]
+                queue.append(nxt)
+
+    def finditer(self, text: Sequence[Hashable]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (start, end, value) for each match; `text[start:end]` is the pattern."""
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        state = 0
+        for end, c in enumerate(text, 1):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            hit = state if out[state] else dict_link[state]
+            while hit > 0:
+                for length, value in out[hit]:
+                    yield end - length, end, value
+                hit = dict_link[hit]
+
+
+class StepMatcher:
+    """
+    Precompiled existing-skill matcher for one roadmap template.
+
+    A step counts as already known when a student skill is a substring of the
+    step's search text ("<skill> <title>"), or the search text is a substring
+    of the student skill. Both directions are answered from automata built once
+    per template, so a request costs one pass over the student's skills.
+    Per-skill masks are memoized since resume skills come from a small vocabulary.
+    """
+
+    MEMO_SIZE = 4096
+
+    def __init__(self, search_texts: List[str]):
+        self._contained_in = SubstringIndex(search_texts)
+        self._contains = AhoCorasick((text, 1 << i) for i, text in enumerate(search_texts))
+        self._shortest_text = min((len(t) for t in search_texts), default=0)
+        self._memo: Dict[str, int] = {}
+
+    def _skill_mask(self, skill: str) -> int:
+        mask = self._contained_in.query(skill)
+        # A skill shorter than every search text cannot contain one
+        if len(skill) >= self._shortest_text:
+            for _, _, bit in self._contains.finditer(skill):
+                mask |= bit
+        return mask
+
+    def match(self, skills: Iterable[str]) -> int:
+        """Return a bitmask over the template's steps (in template order) that the skills cover."""
+        memo = self._memo
+        mask = 0
+        for skill in skills:
+            skill_mask = memo.get(skill)
+            if skill_mask is None:
+                skill_mask = self._skill_mask(skill)
+                if len(memo) >= self.MEMO_SIZE:
+                    memo.clear()
+                memo[skill] = skill_mask
+            mask |= skill_mask
+        return mask
+
+
+class ProjectIndex:
+    """
+    Skill -> project lookup tables for one career's project catalog.
+
+    Projects are numbered in catalog order (duplicates collapsed) and every
+    lookup returns a bitmask, so "first matching project not yet suggested"
+    is a mask operation instead of a scan:
+
+    - tech-stack token (split on "+" and ",") -> projects using it
+    - substring of the title -> projects whose title contains it; this also
+      serves the 4-character prefix fallback
+
+    `base` is the position of the fallback project (-1 when there is none).
+    """
+
+    def __init__(self, projects: List[Dict[str, Any]], base_project: Dict[str, Any] = None):
+        self.projects: List[Dict[str, Any]] = []
+        for project in projects:
+            if project not in self.projects:
+                self.projects.append(project)
+        self.base = self.projects.index(base_project) if base_project is not None else -1
+
+        self._titles = SubstringIndex(p["title"].lower() for p in self.projects)
+        self._tech: Dict[str, int] = {}
+        for i, project in enumerate(self.projects):
+            for token in project["tech_stack"].replace("+", ",").split(","):
+                token = token.strip().lower()
+                self._tech[token] = self._tech.get(token, 0) | (1 << i)
+
+    def by_title_or_tech(self, skill: str) -> int:
+        return self._titles.query(skill) | self._tech.get(skill, 0)
+
+    def by_title(self, fragment: str) -> int:
+        return self._titles.query(fragment)
+
+    @staticmethod
+    def first(mask: int) -> int:
+        """Index of the lowest set bit, or -1 for an empty mask."""
+        return (mask & -mask).bit_length() - 1
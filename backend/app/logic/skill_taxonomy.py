@@ -0,0 +1,133 @@
+"""
+Skill taxonomy: canonical skill names with their aliases, categories and
+descriptions, loaded from a JSON file (app/models_data/skill_taxonomy.json by
+default, CAREERSENSE_SKILL_TAXONOMY to override):
+
+    {"version": 1, "skills": [
+        {"name": "React", "category": "Tools & Frameworks", "description": "...",
+         "aliases": ["ReactJS", "React.js"]},
+        {"name": "Figma", ..., "careers": ["UI/UX Designer"], "unambiguous": true},
+        {"name": "AWS", ..., "aliases": ["Amazon Web Services"], "parent": "Cloud Computing"},
+        ...
+    ]}
+
+Names and aliases are split into word tokens ("React.js" -> react, js;
+"C++" -> c++) and compiled into a token trie with Aho-Corasick failure links,
+so a resume is normalized in one pass over its tokens: the cost grows with the
+text, not with the number of aliases. Where phrases overlap the leftmost,
+longest one wins ("machine learning engineer" is Machine Learning, once).
+
+Aliases are other names for the same skill. A narrower skill (a vendor, a
+branch of a subject) gets an entry of its own with a "parent" instead:
+`with_parents` counts it towards its parent, so AWS meets a Cloud Computing
+requirement, but it never stands in for a sibling (Azure is not AWS).
+
+Aliases should name the skill and nothing else: a word that also turns up in
+ordinary resume prose ("the UI", "a prototype", "the rest of the team") makes
+false hits. Career hints are only taken from entries marked "unambiguous",
+skills that on their own say which way a resume leans.
+"""
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.logic.skill_matcher import AhoCorasick
+
+# Word runs, keeping trailing "+"/"#" so C++ and C# stay distinct from C
+_TOKEN_RE = re.compile(r"\w+[+#]*")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillTaxonomy:
+    """Compiled taxonomy; see module docstring."""
+
+    def __init__(self, skills: List[Dict[str, Any]]):
+        self.skills = skills
+        # Changes whenever any entry does; stored with results derived from the taxonomy
+        self.version = hashlib.sha256(json.dumps(skills, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        self._index: Dict[str, int] = {}
+        # Token sequence -> skill position; the first skill to claim a phrase keeps it
+        self._phrases: Dict[Tuple[str, ...], int] = {}
+        for i, skill in enumerate(skills):
+            self._index.setdefault(skill["name"].lower(), i)
+            for phrase in [skill["name"], *skill.get("aliases", ())]:
+                tokens = tuple(tokenize(phrase))
+                if tokens:
+                    self._phrases.setdefault(tokens, i)
+        self._trie = AhoCorasick(self._phrases.items())
+        for skill in skills:
+            if "parent" in skill and skill["parent"].lower() not in self._index:
+                raise ValueError(f"{skill['name']}: unknown parent skill {skill['parent']!r}")
+
+    @classmethod
+    def load(cls, path: str) -> "SkillTaxonomy":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["skills"])
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Entry for a canonical name (case-insensitive)."""
+        index = self._index.get(name.lower())
+        return self.skills[index] if index is not None else None
+
+    def matches(self, text: str) -> List[Tuple[int, int, int]]:
+        """(first token, end token, skill position) of each phrase in `text`, leftmost-longest."""
+        hits = sorted(
+            (start, -end, index)
+            for start, end, index in self._trie.finditer(tokenize(text))
+        )
+        found, covered = [], 0
+        for start, neg_end, index in hits:
+            if start >= covered:
+                found.append((start, -neg_end, index))
+                covered = -neg_end
+        return found
+
+    def find(self, text: str) -> List[int]:
+        """Positions (in taxonomy order) of the skills mentioned in `text`."""
+        return sorted({index for _, _, index in self.matches(text)})
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical name when the whole of `skill` is a known name or alias."""
+        index = self._phrases.get(tuple(tokenize(skill)))
+        return self.skills[index]["name"] if index is not None else None
+
+    def normalize(self, skills: Iterable[str]) -> List[str]:
+        """Canonical names for known skills, others unchanged; duplicates dropped, order kept."""
+        normalized: Dict[str, str] = {}
+        for skill in skills:
+            name = self.canonical(skill) or skill
+            normalized.setdefault(name.lower(), name)
+        return list(normalized.values())
+
+    def with_parents(self, skills: Iterable[str]) -> List[str]:
+        """`normalize(skills)` followed by the parents of the known ones ("AWS" -> Cloud Computing)."""
+        names = self.normalize(skills)
+        seen = {name.lower() for name in names}
+        for name in names:
+            entry = self.get(name)
+            while entry is not None and "parent" in entry and entry["parent"].lower() not in seen:
+                seen.add(entry["parent"].lower())
+                names.append(entry["parent"])
+                entry = self.get(entry["parent"])
+        return names
+
+    def careers(self, skills: Iterable[str]) -> Set[str]:
+        """Careers the given skills point towards (the "careers" hints of unambiguous entries)."""
+        found: Set[str] = set()
+        for skill in skills:
+            entry = self.get(self.canonical(skill) or skill)
+            if entry is not None and entry.get("unambiguous"):
+                found.update(entry.get("careers", ()))
+        return found
+
+
+skill_taxonomy = SkillTaxonomy.load(settings.SKILL_TAXONOMY_PATH)
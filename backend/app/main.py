@@ -1,9 +1,24 @@
-from fastapi import FastAPI
+import signal
+import threading
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.api import routes, chat
+from app.core import metrics
+from app.core.body_limit import BodySizeLimit
+from app.core.config import settings
+from app.logic.roadmap_engine import roadmap_engine
+from app.services.cohort_service import cohort_pool
+from app.services.extraction_pool import extraction_pool
+from app.services.ml_service import ModelUnavailableError, career_predictor
 
 app = FastAPI(title="CareerSense AI API", version="1.0.0")
 
+# Cut off oversized resume uploads while they stream in, before the form is parsed
+# (registered before CORS, which then wraps it, so browsers can read its 413s)
+app.add_middleware(BodySizeLimit, limits={"/api/analyze-resume": int(settings.RESUME_MAX_UPLOAD_MB * 1024 * 1024)})
+
 # CORS Middleware
 origins = [
     "http://localhost:5173", # Vite default
@@ -18,6 +33,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def warm_up_model():
+    # Map the model in before serving; a missing or broken model stops startup here
+    career_predictor.warmup()
+
+@app.on_event("shutdown")
+def stop_worker_pools():
+    extraction_pool.shutdown()
+    cohort_pool.shutdown()
+
+@app.exception_handler(ModelUnavailableError)
+def model_unavailable(request: Request, exc: ModelUnavailableError):
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+@app.middleware("http")
+async def add_catalog_hash_header(request: Request, call_next):
+    # Lets clients and caches tell whether roadmap metadata changed since they fetched it
+    response = await call_next(request)
+    response.headers["X-Catalog-Hash"] = roadmap_engine.catalog_hash
+    return response
+
+@app.middleware("http")
+async def record_stage_timings(request: Request, call_next):
+    # Stages timed with metrics.stage() during the request land in per-stage histograms
+    timer = metrics.start_request()
+    response = await call_next(request)
+    stages = timer.finish()
+    metrics.stage_metrics.observe(metrics.route_label(request.scope), stages, timer.labels)
+    if settings.SERVER_TIMING:
+        response.headers["Server-Timing"] = metrics.server_timing(stages)
+    return response
+
+def _reload_catalog_on_sighup(signum, frame):
+    # Do the I/O off the signal handler; requests keep using the old catalog meanwhile
+    threading.Thread(target=roadmap_engine.reload_catalog, name="catalog-reload", daemon=True).start()
+
+if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+    signal.signal(signal.SIGHUP, _reload_catalog_on_sighup)
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to CareerSense AI API"}
@@ -27,7 +81,7 @@ from app.api import auth, comments, community, jobs
 
 # Import ALL models so they register with Base before create_all
 from app.models.user import User
-from app.models.roadmap import Roadmap
+from app.models.roadmap import Roadmap, RoadmapRevision
 from app.models.comment import Comment
 from app.models.community_message import CommunityMessage
 from app.models.helpdesk import HelpDeskTicket
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Union
 
 class StudentProfile(BaseModel):
     name: str
@@ -36,24 +36,41 @@ class CareerPredictionResponse(BaseModel):
     probabilities: List[CareerProbability] = []
     extracted_skills: List[SkillMetadata] = []
     missing_skills: List[str] = []
-    recommended_roadmap: List[dict] = []
+    # Legacy list of phases, or the compact v2 payload when ?format=v2
+    recommended_roadmap: Union[List[dict], dict] = []
     radar_data: List[dict] = []
     career_match_score: Optional[float] = None
     next_recommended_skill: Optional[str] = None
     probability_chart_data: List[dict] = []
     skill_comparison_data: List[dict] = []
     featured_projects: List[ProjectMetadata] = []
+    # Content hash of the roadmap catalog the metadata above came from
+    catalog_hash: Optional[str] = None
+    # Registry version of the career model that made the prediction
+    model_version: Optional[str] = None
+
+class BatchPrediction(BaseModel):
+    predicted_career: str
+    confidence: Optional[float] = None
+    probabilities: List[CareerProbability] = []
+    model_version: Optional[str] = None
+
+class BatchPredictionResponse(BaseModel):
+    count: int
+    results: List[BatchPrediction]
 
 class SkillGapResponse(BaseModel):
     extracted_skills: List[SkillMetadata]
     missing_skills: List[str]
-    recommended_roadmap: List[dict]
+    recommended_roadmap: Union[List[dict], dict]
     radar_data: List[dict] = []
     career_match_score: Optional[float] = None
     next_recommended_skill: Optional[str] = None
     probability_chart_data: List[dict] = []
     skill_comparison_data: List[dict] = []
     featured_projects: List[ProjectMetadata] = []
+    # Content hash of the roadmap catalog the metadata above came from
+    catalog_hash: Optional[str] = None
 
 class HelpDeskTicketCreate(BaseModel):
     name: str
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON, DateTime, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, JSON, DateTime, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.database import Base
@@ -9,9 +9,27 @@ class Roadmap(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     career_path = Column(String(255))
-    content = Column(JSON)  # Stores the full roadmap JSON structure
+    content = Column(JSON)  # Stores the latest roadmap JSON structure
     status = Column(String(50), default="active")  # active, completed, archived
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User", back_populates="roadmaps")
+    revisions = relationship("RoadmapRevision", back_populates="roadmap", order_by="RoadmapRevision.version")
+
+class RoadmapRevision(Base):
+    """
+    Reverse patch that rebuilds an earlier version of a roadmap from the next one.
+    Applying the patches for versions N-1, N-2, ..., k to Roadmap.content (version N)
+    reconstructs version k.
+    """
+    __tablename__ = "roadmap_revisions"
+    __table_args__ = (UniqueConstraint("roadmap_id", "version"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    roadmap_id = Column(Integer, ForeignKey("roadmaps.id"), index=True)
+    version = Column(Integer)  # The version this patch reconstructs
+    patch = Column(JSON)  # JSON Patch operations from version + 1 back to version
+    created_at = Column(DateTime)  # When `version` was generated
+
+    roadmap = relationship("Roadmap", back_populates="revisions")
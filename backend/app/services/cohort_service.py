@@ -0,0 +1,227 @@
+"""
+Batch career prediction + roadmap generation for whole cohorts.
+
+Rows are fanned out in chunks across a process pool and results come back in
+input order, so they can be streamed as NDJSON while later chunks are still
+running. Usable from the API (`/api/predict-career/cohort`) or the command line:
+
+    python -m app.services.cohort_service scores.csv -o results.ndjson --workers 16
+
+Each worker is a fresh interpreter that imports the app and loads the model,
+so the API keeps one pool for all requests (`cohort_pool`) instead of paying
+that on every upload; the command line starts its own.
+"""
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from app.models.api_schemas import CareerInput
+
+DEFAULT_CHUNK_SIZE = 256
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def read_csv_rows(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield one dict per CSV row; the header must use the CareerInput field names."""
+    yield from csv.DictReader(lines)
+
+
+def count_csv_rows(lines: Iterable[str]) -> int:
+    """Rows `read_csv_rows` yields (blank lines skipped, quoted fields may span lines)."""
+    return sum(1 for _ in read_csv_rows(lines))
+
+
+def _init_worker() -> None:
+    # Load the model and engine tables once per worker, not per chunk
+    from app.services.ml_service import career_predictor
+    from app.logic import roadmap_engine  # noqa: F401
+
+    career_predictor.warmup()
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn: forking a server process that already runs threads is unsafe
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker)
+
+
+class CohortPool:
+    """One worker per core, started on first use and kept for later requests."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = _new_pool(self.workers)
+            return self._pool
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        pool = self._current()
+        try:
+            return pool.submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker that died (e.g. OOM-killed) breaks the whole executor; start over
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            return self._current().submit(fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+cohort_pool = CohortPool()
+
+
+def predict_rows(rows: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Predict a career and build the compact roadmap for each (row number, row) pair."""
+    from app.services.ml_service import career_predictor
+    from app.logic.roadmap_engine import roadmap_engine, scores_from_profile
+    from app.logic.roadmap_format import compact_roadmap
+
+    results: List[Dict[str, Any]] = []
+    valid = []
+    for row_number, row in rows:
+        try:
+            valid.append((row_number, dict(CareerInput(**row))))
+        except Exception as e:
+            results.append({"row": row_number, "error": f"Invalid row: {e}"})
+
+    # One model call for the whole chunk
+    predictions = career_predictor.predict_batch([profile for _, profile in valid])
+    for (row_number, profile), prediction in zip(valid, predictions):
+        career = prediction.get("predicted_career", "General Analyst")
+        confidence = prediction.get("confidence", 0.85)
+        roadmap = roadmap_engine.generate(career, scores_from_profile(profile), [], confidence=confidence)
+        results.append({
+            "row": row_number,
+            "predicted_career": career,
+            "confidence": confidence,
+            "probabilities": prediction.get("probabilities", []),
+            "model_version": prediction.get("model_version"),
+            "roadmap": compact_roadmap(roadmap),
+        })
+
+    results.sort(key=lambda result: result["row"])
+    return results
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    chunk = []
+    for row_number, row in enumerate(rows, 1):
+        chunk.append((row_number, row))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_cohort(
+    rows: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    total: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    pool: Optional[Union[ProcessPoolExecutor, CohortPool]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one result per input row, in input order.
+
+    At most two chunks per worker are in flight, so memory stays bounded for
+    arbitrarily large inputs. `on_progress(done, total)` fires after each chunk.
+    Runs on `pool` if given (`workers` then only sizes the in-flight window),
+    otherwise on a pool of `workers` processes started for this call.
+    """
+    workers = workers or os.cpu_count() or 1
+    if pool is None:
+        with _new_pool(workers) as own_pool:
+            yield from _run_chunks(own_pool, rows, workers, chunk_size, total, on_progress)
+    else:
+        yield from _run_chunks(pool, rows, workers, chunk_size, total, on_progress)
+
+
+def _run_chunks(
+    pool: Union[ProcessPoolExecutor, CohortPool],
+    rows: Iterable[Dict[str, Any]],
+    workers: int,
+    chunk_size: int,
+    total: Optional[int],
+    on_progress: Optional[ProgressCallback],
+) -> Iterator[Dict[str, Any]]:
+    done = 0
+    pending = deque()
+    chunks = _chunks(rows, chunk_size)
+    try:
+        for chunk in chunks:
+            pending.append(pool.submit(predict_rows, chunk))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            results = pending.popleft().result()
+            next_chunk = next(chunks, None)
+            if next_chunk is not None:
+                pending.append(pool.submit(predict_rows, next_chunk))
+
+            yield from results
+            done += len(results)
+            if on_progress:
+                on_progress(done, total)
+    finally:
+        # A client that disconnects mid-stream should not leave its chunks queued on a shared pool
+        for future in pending:
+            future.cancel()
+
+
+def to_ndjson(results: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for result in results:
+        yield json.dumps(result, separators=(",", ":")) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Predict careers and roadmaps for a cohort CSV.")
+    parser.add_argument("csv_path", help="CSV with CareerInput columns (math_score, programming_score, ...)")
+    parser.add_argument("-o", "--output", help="NDJSON output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    with open(args.csv_path, newline="", encoding="utf-8") as f:
+        total = count_csv_rows(f)
+
+    def report(done: int, total: Optional[int]) -> None:
+        print(f"\r{done}/{total} rows", end="", file=sys.stderr, flush=True)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with open(args.csv_path, newline="", encoding="utf-8") as f:
+            results = run_cohort(read_csv_rows(f), args.workers, args.chunk_size, total, report)
+            for line in to_ndjson(results):
+                out.write(line)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+Worker processes for resume text extraction.
+
+pypdf and python-docx are pure Python and CPU-bound: run in the API process,
+a long document holds the GIL (or the event loop) for as long as it takes.
+The pool keeps up to `workers` spawned processes, each running one job at a
+time:
+
+- a job still running after `timeout` seconds has its worker killed and
+  replaced, so a pathological document costs one timeout, not a worker;
+- at most `max_queue` callers wait for a free worker; further jobs are turned
+  away with ExtractionBusyError instead of piling up;
+- `stats()` reports busy/idle workers, saturation, queue depth, queue wait and
+  run time histograms, and job outcomes.
+
+Documents travel as bytes, or as the path of an upload spooled to disk, and
+the page, decompressed-size and skill-saturation limits are applied by the
+parser inside the worker (see ResumeParser.extract_resume).
+"""
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import LatencyHistogram
+from app.services.resume_parser import Source, resume_parser
+
+# Generous: a fresh worker imports pypdf, python-docx and the skill taxonomy
+STARTUP_TIMEOUT = 30.0
+
+
+class ExtractionError(RuntimeError):
+    """An extraction job could not be run to completion."""
+
+
+class ExtractionTimeoutError(ExtractionError):
+    """The job ran past the pool's timeout; its worker was killed."""
+
+
+class ExtractionBusyError(ExtractionError):
+    """Every worker is busy and the wait queue is full."""
+
+
+def extract_resume(
+    kind: str,
+    source: Source,
+    max_pages: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    saturation: Optional[int] = None,
+) -> Tuple[str, List[Dict[str, str]]]:
+    """Text and skills of a "pdf" or "docx" resume given as bytes or a file path."""
+    if kind not in ("pdf", "docx"):
+        raise ValueError(f"Unsupported document type {kind!r}")
+    return resume_parser.extract_resume(kind, source, max_pages, max_bytes, saturation)
+
+
+def _worker_main(conn) -> None:
+    conn.send(("ready", None))
+    while True:
+        try:
+            fn, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            result = ("ok", fn(*args))
+        except Exception as e:
+            result = ("error", e)
+        conn.send(result)
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), name="resume-extraction", daemon=True)
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(STARTUP_TIMEOUT):
+            self.kill()
+            raise ExtractionError("Extraction worker did not start")
+        self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ExtractionPool:
+    """Bounded pool of extraction processes; see module docstring."""
+
+    def __init__(
+        self,
+        workers: int = settings.RESUME_EXTRACTION_WORKERS,
+        timeout: float = settings.RESUME_EXTRACTION_TIMEOUT,
+        max_queue: int = settings.RESUME_EXTRACTION_QUEUE,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_queue = max_queue
+        # spawn: forking a server process that already runs threads is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._free = threading.Condition()
+        self._idle: List[_Worker] = []
+        self._busy = 0
+        self._queued = 0
+        self._closed = False
+        self._outcomes = {"completed": 0, "failed": 0, "timed_out": 0, "rejected": 0}
+        self._queue_wait = LatencyHistogram()
+        self._run_time = LatencyHistogram()
+
+    def _acquire(self) -> _Worker:
+        with self._free:
+            started = time.perf_counter()
+            if self._busy >= self.workers:
+                if self._queued >= self.max_queue:
+                    self._outcomes["rejected"] += 1
+                    raise ExtractionBusyError(f"All {self.workers} extraction workers are busy")
+                self._queued += 1
+                try:
+                    while self._busy >= self.workers:
+                        self._free.wait()
+                finally:
+                    self._queued -= 1
+            self._queue_wait.observe((time.perf_counter() - started) * 1000)
+            self._busy += 1
+            worker = self._idle.pop() if self._idle else None
+        if worker is None:
+            try:
+                worker = _Worker(self._context)
+            except BaseException:
+                self._release(None)
+                raise
+        return worker
+
+    def _release(self, worker: Optional[_Worker], outcome: Optional[str] = None, seconds: Optional[float] = None) -> None:
+        with self._free:
+            self._busy -= 1
+            if worker is not None and not self._closed:
+                self._idle.append(worker)
+                worker = None
+            if outcome is not None:
+                self._outcomes[outcome] += 1
+            if seconds is not None:
+                self._run_time.observe(seconds * 1000)
+            self._free.notify()
+        if worker is not None:
+            worker.kill()
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call `fn(*args)` in a worker process and return its result, re-raising
+        its exception. `fn` must be a module-level function.
+        """
+        if self.workers <= 0:
+            return fn(*args)
+        worker = self._acquire()
+        started = time.perf_counter()
+        outcome = "failed"
+        try:
+            worker.conn.send((fn, args))
+            if not worker.conn.poll(self.timeout):
+                worker.kill()
+                worker = None
+                outcome = "timed_out"
+                raise ExtractionTimeoutError(f"Extraction took longer than {self.timeout:g}s")
+            status, result = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            # The worker died mid-job (crash, OOM kill); replace it
+            if worker is not None:
+                worker.kill()
+                worker = None
+            raise ExtractionError(f"Extraction worker died: {e}") from e
+        else:
+            outcome = "completed" if status == "ok" else "failed"
+        finally:
+            self._release(worker, outcome, time.perf_counter() - started)
+        if status == "error":
+            raise result
+        return result
+
+    def extract(self, kind: str, source: Source) -> Tuple[str, List[Dict[str, str]]]:
+        """Text and skills of a "pdf" or "docx" upload, within the configured page and size limits."""
+        max_bytes = int(settings.RESUME_MAX_DECOMPRESSED_MB * 1024 * 1024)
+        return self.run(extract_resume, kind, source, settings.RESUME_MAX_PAGES, max_bytes, settings.RESUME_SKILL_SATURATION)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._free:
+            return {
+                "workers": self.workers,
+                "busy": self._busy,
+                "idle": len(self._idle),
+                "saturation": round(self._busy / self.workers, 3) if self.workers > 0 else 0.0,
+                "queued": self._queued,
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout,
+                **self._outcomes,
+                "queue_wait": self._queue_wait.snapshot(),
+                "run": self._run_time.snapshot(),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the idle workers; busy ones are stopped when their job returns."""
+        with self._free:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.kill()
+
+
+extraction_pool = ExtractionPool()
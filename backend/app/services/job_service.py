@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional
 
+from app.logic.skill_taxonomy import skill_taxonomy
+
 class JobService:
     # Curated dataset of companies and their primary hiring categories
     COMPANIES = {
@@ -55,13 +57,22 @@ class JobService:
     }
 
     @staticmethod
-    def calculate_match(user_skills: List[str], required_skills: List[str]) -> Dict[str, Any]:
+    def _has_skill(user_skills_lower: set, required: str) -> bool:
+        """Aliases count as their canonical skill; a combined requirement ("HTML/CSS") needs each part."""
+        canonical = skill_taxonomy.canonical(required)
+        if canonical is not None or required.lower() in user_skills_lower:
+            return (canonical or required).lower() in user_skills_lower
+        parts = [skill_taxonomy.skills[i]["name"].lower() for i in skill_taxonomy.find(required)]
+        return bool(parts) and all(p in user_skills_lower for p in parts)
+
+    @classmethod
+    def calculate_match(cls, user_skills: List[str], required_skills: List[str]) -> Dict[str, Any]:
         """Calculate skill match percentage and identify gaps."""
-        user_skills_lower = [s.lower() for s in user_skills]
-        required_skills_lower = [s.lower() for s in required_skills]
+        # A narrower skill also meets its parent's requirement (AWS -> Cloud Computing)
+        user_skills_lower = {s.lower() for s in skill_taxonomy.with_parents(user_skills)}
         
-        matched_skills = [s for s in required_skills_lower if s in user_skills_lower]
-        missing_skills = [s for s in required_skills if s.lower() not in user_skills_lower]
+        matched_skills = [s.lower() for s in required_skills if cls._has_skill(user_skills_lower, s)]
+        missing_skills = [s for s in required_skills if s.lower() not in matched_skills]
         
         match_percentage = (len(matched_skills) / len(required_skills)) * 100 if required_skills else 0
         
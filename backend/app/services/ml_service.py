@@ -1,61 +1,615 @@
+import asyncio
+import bisect
+import concurrent.futures
+import hashlib
 import pickle
+import shutil
+import tempfile
+import threading
+import time
 import numpy as np
 import os
 import pandas as pd
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
-class CareerPredictor:
-    def __init__(self):
-        self.model_path = os.path.join(os.path.dirname(__file__), "../models_data/career_model.pkl")
-        self.model = None
-        self._load_model()
+from app.core.config import settings
+from app.core.metrics import stage
+from app.services.model_registry import FOREST_FILE, MODEL_FILE, TABLE_FILE, ModelRegistry
 
-    def _load_model(self):
-        try:
-            if os.path.exists(self.model_path):
-                with open(self.model_path, "rb") as f:
-                    self.model = pickle.load(f)
-                print("Model loaded successfully.")
+# Training feature order (see ml/train_model.py)
+FEATURES = (
+    "math_score",
+    "programming_score",
+    "communication_score",
+    "problem_solving_score",
+    "interest_coding",
+    "interest_design",
+    "interest_management",
+)
+
+# Above this many rows sklearn's compiled tree walk overtakes the NumPy evaluator
+FLAT_FOREST_MAX_ROWS = 256
+
+class FlatForest:
+    """
+    NumPy evaluator for a forest exported by `ml/train_model.py` (export_forest).
+
+    All trees are walked at once, one level per step, for one row or a batch;
+    this avoids sklearn's per-call validation, joblib dispatch and per-tree
+    Python calls, which dominate the cost of scoring a single 7-feature row.
+    `predict_proba` matches RandomForestClassifier.predict_proba.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        # children[2 * node + went_left], mapped like every other array; exports
+        # from before it was added only have separate left/right arrays
+        self.children = arrays.get("children")
+        self.left = arrays.get("left")
+        self.right = arrays.get("right")
+        self.value = arrays["value"]
+        self.root = arrays["root"]
+        self.classes_ = arrays["classes"]
+        self.max_depth = int(arrays["max_depth"])
+        self.model_sha256 = str(arrays["model_sha256"])
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        # Trees compare float32 inputs, like sklearn does
+        features = np.asarray(features, dtype=np.float32)
+        flat = features.ravel()
+        row_offsets = (np.arange(len(features)) * features.shape[1])[:, None]
+        node = np.broadcast_to(self.root, (len(features), len(self.root)))
+        for _ in range(self.max_depth):
+            went_left = flat[row_offsets + self.feature[node]] <= self.threshold[node]
+            if self.children is not None:
+                node = self.children[2 * node + went_left]
             else:
-                print(f"Model not found at {self.model_path}. Please train the model first.")
-        except Exception as e:
-            print(f"Error loading model: {e}")
+                node = np.where(went_left, self.left[node], self.right[node])
+        return self.value[node].sum(axis=1) / len(self.root)
 
-    def predict(self, input_data: dict):
-        if self.model is None:
-            return {"predicted_career": "Education Error", "probabilities": []}
-            
-        try:
-            # Match the training features
-            features = [
-                input_data.get('math_score', 0),
-                input_data.get('programming_score', 0),
-                input_data.get('communication_score', 0),
-                input_data.get('problem_solving_score', 0),
-                input_data.get('interest_coding', 0),
-                input_data.get('interest_design', 0),
-                input_data.get('interest_management', 0)
-            ]
-            
-            prediction = self.model.predict([features])[0]
-            
-            # Extract probabilities
-            class_names = self.model.classes_
-            probabilities = self.model.predict_proba([features])[0]
-            
-            prob_list = [
-                {"name": name, "prob": round(float(prob) * 100, 2)}
-                for name, prob in zip(class_names, probabilities)
-            ]
-            
-            # Sort by probability descending
-            prob_list = sorted(prob_list, key=lambda x: x['prob'], reverse=True)
-            
+class PredictionTable:
+    """
+    Predictions precomputed by `ml/train_model.py` (build_prediction_table).
+
+    Keyed by threshold bins rather than raw values: an input whose seven
+    features each fall in a bin that contains a grid value gets the exact
+    probabilities live inference would return. Anything else is a miss.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        n_features = len(arrays["strides"])
+        # Plain lists: bisect on a list beats NumPy for one scalar
+        self.thresholds = [arrays[f"thresholds_{i}"].tolist() for i in range(n_features)]
+        self.bin_to_grid = [arrays[f"bin_to_grid_{i}"].tolist() for i in range(n_features)]
+        self.strides = arrays["strides"].tolist()
+        self.index = arrays["index"]
+        self.probabilities = arrays["probabilities"]
+        self.classes_ = arrays["classes"]
+        self.model_sha256 = str(arrays["model_sha256"])
+
+    def lookup(self, values: List[Any]) -> Optional[np.ndarray]:
+        """predict_proba row for one input, or None if it is off the grid."""
+        position = 0
+        # Trees compare float32 inputs
+        for value, thresholds, bin_to_grid, stride in zip(np.asarray(values, dtype=np.float32).tolist(), self.thresholds, self.bin_to_grid, self.strides):
+            grid_index = bin_to_grid[bisect.bisect_left(thresholds, value)]
+            if grid_index < 0:
+                return None
+            position += grid_index * stride
+        return self.probabilities[self.index[position]]
+
+
+class PredictionMemo:
+    """Bounded LRU of exact inputs -> prediction results (shared, read-only)."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
             return {
-                "predicted_career": prediction,
-                "probabilities": prob_list
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
             }
+
+
+class SchedulerStoppedError(RuntimeError):
+    """The scheduler loop died with this row still queued."""
+
+
+class InferenceScheduler:
+    """
+    Micro-batches concurrent single-row predictions.
+
+    Rows submitted from any thread are queued on a private asyncio loop. A
+    batch closes when it reaches `max_batch` rows or `max_wait` seconds after
+    its first row, and then goes through one `predict_batch(rows, model)`
+    call per model version the rows were submitted for; each caller's future
+    resolves with its own row's result. Many concurrent requests thus share
+    one model pass instead of contending for the GIL with one pass each.
+    """
+
+    # Slack on top of `max_wait` before a caller stops waiting for its batch
+    TIMEOUT_GRACE = 2.0
+
+    def __init__(self, predict_batch: Callable[[List[Dict[str, Any]], Any], List[Dict[str, Any]]], max_batch: int = 64, max_wait: float = 0.002):
+        self.predict_batch = predict_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.rows = 0
+        self.timeouts = 0
+        self._pending: List[Tuple[Dict[str, Any], Any, concurrent.futures.Future]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            # (Re)start if the loop thread never ran or died on an unexpected error
+            if self._loop is None or not self._thread.is_alive():
+                stranded, self._pending = self._pending, []
+                loop = asyncio.new_event_loop()
+                self._has_rows = asyncio.Event()
+                self._full = asyncio.Event()
+                self._thread = threading.Thread(target=self._serve, args=(loop,), name="inference-scheduler", daemon=True)
+                self._thread.start()
+                self._loop = loop
+                for _, _, future in stranded:
+                    future.set_exception(SchedulerStoppedError("Inference scheduler loop stopped"))
+        return self._loop
+
+    def _serve(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._run())
+
+    def _enqueue(self, row: Dict[str, Any], model: Any, future: concurrent.futures.Future) -> None:
+        # Runs on the scheduler loop
+        self._pending.append((row, model, future))
+        self._has_rows.set()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_rows.wait()
+            if len(self._pending) < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+            if not self._pending:
+                self._has_rows.clear()
+            if len(self._pending) < self.max_batch:
+                self._full.clear()
+
+            # Callers that gave up (e.g. a cancelled `predict` await) drop out; the rest can no longer be cancelled
+            batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+            self.rows += len(batch)
+            # Rows queued across a model swap are scored by the version they were submitted for
+            by_model: Dict[int, Tuple[Any, List[Tuple[Dict[str, Any], concurrent.futures.Future]]]] = {}
+            for row, model, future in batch:
+                by_model.setdefault(id(model), (model, []))[1].append((row, future))
+            for model, items in by_model.values():
+                self.batches += 1
+                try:
+                    results = self.predict_batch([row for row, _ in items], model)
+                except Exception as e:
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+                for (_, future), result in zip(items, results):
+                    future.set_result(result)
+
+    def submit(self, row: Dict[str, Any], model: Any = None) -> concurrent.futures.Future:
+        """Queue one row from any thread (e.g. a sync route); the future resolves to its result."""
+        loop = self._loop
+        if loop is None or not self._thread.is_alive():
+            loop = self._start()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        loop.call_soon_threadsafe(self._enqueue, row, model, future)
+        return future
+
+    @property
+    def timeout(self) -> float:
+        """How long a caller waits for its row before giving up on the scheduler."""
+        return self.max_wait + self.TIMEOUT_GRACE
+
+    async def predict(self, row: Dict[str, Any], model: Any = None) -> Dict[str, Any]:
+        """Awaitable form of `submit` for async callers."""
+        return await asyncio.wrap_future(self.submit(row, model))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batches,
+            "rows": self.rows,
+            "mean_batch_size": round(self.rows / self.batches, 2) if self.batches else 0.0,
+            "timeouts": self.timeouts,
+        }
+
+
+def _format_predictions(raw: np.ndarray, classes: np.ndarray, model_version: str) -> List[Dict[str, Any]]:
+    """Turn predict_proba rows into result dicts with classes ranked by probability."""
+    confidences = raw.max(axis=1).tolist()
+    probabilities = np.round(raw * 100, 2)
+
+    # Rank classes per row, highest first; stable so ties keep class order
+    order = np.argsort(-probabilities, axis=1, kind="stable")
+    ranked_names = np.asarray(classes)[order].tolist()
+    ranked_probs = np.take_along_axis(probabilities, order, axis=1).tolist()
+
+    return [
+        {
+            # Forest predict() is the argmax of predict_proba
+            "predicted_career": names[0],
+            "confidence": confidence,
+            "probabilities": [{"name": name, "prob": prob} for name, prob in zip(names, probs)],
+            "model_version": model_version,
+        }
+        for names, probs, confidence in zip(ranked_names, ranked_probs, confidences)
+    ]
+
+
+class ModelUnavailableError(RuntimeError):
+    """The career model is missing or cannot be loaded."""
+
+
+def _remove_stale_unpacks(directory: str, archive: str, current: str) -> None:
+    """Delete unpacked copies of earlier exports of `archive` (processes still mapping them keep their pages)."""
+    prefix = f"{archive}."
+    for entry in os.listdir(directory):
+        digest = entry[len(prefix):-len(".mmap")]
+        if entry != current and entry.startswith(prefix) and entry.endswith(".mmap") and len(digest) == 16:
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+
+
+def _unpack(path: str, directory: str, name: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=directory, prefix=".unpack-")
+    with np.load(path, allow_pickle=False) as data:
+        for member in data.files:
+            np.save(os.path.join(staging, f"{member}.npy"), data[member])
+    try:
+        os.rename(staging, os.path.join(directory, name))
+    except OSError:
+        # Another worker got there first
+        shutil.rmtree(staging, ignore_errors=True)
+    else:
+        _remove_stale_unpacks(directory, os.path.basename(path), name)
+
+
+def _load_arrays(path: str) -> Dict[str, np.ndarray]:
+    """
+    Arrays of an exported .npz, memory-mapped read-only so every worker
+    process on the box shares one physical copy through the page cache.
+
+    np.load cannot map .npz members, so the archive is unpacked once into a
+    sibling directory of .npy files named after its content hash (or, when the
+    model directory is read-only, into a temp directory of its own per model
+    directory) and mapped from there. Unpacking a new export removes the
+    copies of earlier ones of the same file.
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+
+    name = f"{os.path.basename(path)}.{digest}.mmap"
+    source_dir = os.path.dirname(os.path.abspath(path))
+    # Registry versions share file names: keep each one's fallback copies apart
+    fallback_dir = os.path.join(tempfile.gettempdir(), "careersense-models", hashlib.sha256(source_dir.encode("utf-8")).hexdigest()[:16])
+    for directory in (source_dir, fallback_dir):
+        target = os.path.join(directory, name)
+        # A second try covers the copy being removed under us (a newer export replaced it)
+        for _ in range(2):
+            try:
+                if not os.path.isdir(target):
+                    _unpack(path, directory, name)
+                return {
+                    entry[:-len(".npy")]: np.load(os.path.join(target, entry), mmap_mode="r", allow_pickle=False)
+                    for entry in os.listdir(target)
+                    if entry.endswith(".npy")
+                }
+            except FileNotFoundError:
+                continue
+            except OSError:
+                break
+    raise ModelUnavailableError(f"Cannot unpack {path} for memory mapping")
+
+
+class ModelVersion:
+    """
+    One registry version of the career model. Nothing is read up front: the
+    flattened forest and prediction table are memory-mapped on first use,
+    and the sklearn pickle is only unpickled when it is actually needed
+    (batches above FLAT_FOREST_MAX_ROWS, or no usable export).
+    """
+
+    def __init__(self, registry: ModelRegistry, version: str):
+        self.version = version
+        self.metadata = registry.metadata(version)
+        self.model_path = registry.path(version, MODEL_FILE)
+        self.forest_path = registry.path(version, FOREST_FILE)
+        self.table_path = registry.path(version, TABLE_FILE)
+        self.forest = None
+        self.table = None
+        self._model = None
+        self._loaded = False
+        self._load_lock = threading.RLock()
+
+    @property
+    def model(self):
+        """The sklearn forest, unpickled on first access."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    if not os.path.exists(self.model_path):
+                        raise ModelUnavailableError(f"Model not found at {self.model_path}. Please train the model first.")
+                    try:
+                        with open(self.model_path, "rb") as f:
+                            self._model = pickle.load(f)
+                    except Exception as e:
+                        raise ModelUnavailableError(f"Error loading model {self.model_path}: {e}") from e
+        return self._model
+
+    def ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            if not os.path.exists(self.model_path):
+                raise ModelUnavailableError(f"Model not found at {self.model_path}. Please train the model first.")
+            self._load_exports()
+            if self.forest is None:
+                self.model  # no usable export: every prediction needs sklearn
+            self._loaded = True
+
+    def _load_exports(self):
+        # Derived artifacts are only used if they were made from this exact pickle
+        with open(self.model_path, "rb") as f:
+            model_sha256 = hashlib.sha256(f.read()).hexdigest()
+        for attr, loader, path in (("forest", FlatForest, self.forest_path), ("table", PredictionTable, self.table_path)):
+            if not os.path.exists(path):
+                continue
+            try:
+                export = loader(_load_arrays(path))
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+                continue
+            if export.model_sha256 != model_sha256:
+                print(f"{os.path.basename(path)} is out of date, ignoring it. Re-run: python ml/train_model.py --export-only")
+                continue
+            setattr(self, attr, export)
+
+
+class CareerPredictor:
+    """
+    Career model front end serving the registry's active version (see
+    model_registry). The version is loaded on first use, or by `warmup()` at
+    server startup; a missing model raises ModelUnavailableError.
+
+    `activate()` swaps versions atomically: the new version is loaded and
+    warmed up first, then replaces the active one in a single assignment.
+    Every prediction captures the version once, so requests already running
+    finish on the old one, and every result records `model_version`. Other
+    workers notice the new CURRENT within MODEL_POLL_SECONDS and swap the
+    same way on a background thread.
+    """
+
+    def __init__(self, registry_dir: Optional[str] = None):
+        self.registry = ModelRegistry(registry_dir or settings.MODEL_REGISTRY_DIR)
+        self._active: Optional[ModelVersion] = None
+        self._current_stamp: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._swap_lock = threading.Lock()
+        self._following = False
+        self.memo = PredictionMemo(settings.PREDICTION_MEMO_SIZE)
+        # Live single-row misses are micro-batched across concurrent requests
+        self.scheduler = InferenceScheduler(self.predict_batch, settings.PREDICTION_MAX_BATCH, settings.PREDICTION_MAX_WAIT_MS / 1000)
+        self.table_hits = 0
+        self.table_misses = 0
+        self._counter_lock = threading.Lock()
+
+    @property
+    def active(self) -> ModelVersion:
+        """The version new predictions use."""
+        active = self._active
+        if active is None:
+            with self._swap_lock:
+                if self._active is None:
+                    version, self._current_stamp = self.registry.current()
+                    self._checked_at = time.monotonic()
+                    try:
+                        self._active = ModelVersion(self.registry, version)
+                    except KeyError:
+                        raise ModelUnavailableError(f"No active model in {self.registry.root}. Please train the model first.") from None
+                return self._active
+        if 0 < settings.MODEL_POLL_SECONDS <= time.monotonic() - self._checked_at:
+            self._follow_current()
+        return active
+
+    @property
+    def model_version(self) -> str:
+        return self.active.version
+
+    # The active version's estimators
+    @property
+    def model(self):
+        return self.active.model
+
+    @property
+    def forest(self) -> Optional[FlatForest]:
+        return self.active.forest
+
+    @property
+    def table(self) -> Optional[PredictionTable]:
+        return self.active.table
+
+    def _follow_current(self):
+        self._checked_at = time.monotonic()
+        version, stamp = self.registry.current()
+        if stamp == self._current_stamp or self._following:
+            return
+        self._current_stamp = stamp
+        if version is None or version == self._active.version:
+            return
+        # Another worker switched versions: load it off the request path
+        self._following = True
+
+        def follow():
+            try:
+                self.activate(version, persist=False)
+            except Exception as e:
+                print(f"Cannot switch to model {version}: {e}")
+            finally:
+                self._following = False
+
+        threading.Thread(target=follow, name="model-swap", daemon=True).start()
+
+    def activate(self, version: str, persist: bool = True) -> Dict[str, Any]:
+        """
+        Load and warm up `version`, then make it the active model. With
+        `persist`, CURRENT is rewritten too so other workers and restarts
+        follow. Raises KeyError for an unknown version and
+        ModelUnavailableError if it cannot be loaded; the old version stays
+        active in both cases.
+        """
+        candidate = ModelVersion(self.registry, version)
+        candidate.ensure_loaded()
+        self.predict_batch([{name: 0 for name in FEATURES}], candidate)
+        with self._swap_lock:
+            previous = self._active
+            if persist:
+                self.registry.set_current(version)
+                self._current_stamp = self.registry.current()[1]
+            self._active = candidate
+        previous_version = previous.version if previous is not None else None
+        return {"model_version": version, "previous_version": previous_version, "changed": previous_version != version}
+
+    def list_models(self) -> List[Dict[str, Any]]:
+        """Metadata of every registered version, oldest first."""
+        active_version = self._active.version if self._active is not None else self.registry.current()[0]
+        return [dict(self.registry.metadata(version), active=version == active_version) for version in self.registry.versions()]
+
+    def warmup(self):
+        """Load the model and run one prediction, so the first request does not pay for it."""
+        model = self.active
+        model.ensure_loaded()
+        self.predict_batch([{name: 0 for name in FEATURES}], model)
+        print(f"Model {model.version} loaded successfully.")
+
+    def predict(self, input_data: dict):
+        """
+        Predict one student. The forest runs once: the predicted class is the
+        argmax of predict_proba and `confidence` is its probability (0-1).
+
+        Repeated inputs are served from an exact-input LRU memo, then from the
+        precomputed table; live inference only runs on misses, batched with
+        other concurrent misses by `scheduler`. The returned dict may be
+        shared between callers and must not be mutated.
+        """
+        with stage("inference"):
+            return self._predict(input_data)
+
+    def _predict(self, input_data: dict):
+        model = self.active
+        key = (model.version,) + tuple(input_data.get(name, 0) for name in FEATURES)
+        result = self.memo.get(key)
+        if result is not None:
+            return result
+
+        model.ensure_loaded()
+        raw = model.table.lookup(key[1:]) if model.table is not None else None
+        if raw is not None:
+            with self._counter_lock:
+                self.table_hits += 1
+            result = _format_predictions(raw[None, :], model.table.classes_, model.version)[0]
+        else:
+            with self._counter_lock:
+                self.table_misses += 1
+            if self.scheduler.max_batch > 1:
+                try:
+                    result = self.scheduler.submit(input_data, model).result(timeout=self.scheduler.timeout)
+                except (concurrent.futures.TimeoutError, SchedulerStoppedError):
+                    # The scheduler loop stalled or died; don't hold a request thread hostage to it
+                    with self._counter_lock:
+                        self.scheduler.timeouts += 1
+                    result = self.predict_batch([input_data], model)[0]
+            else:
+                result = self.predict_batch([input_data], model)[0]
+        if "confidence" in result:
+            self.memo.put(key, result)
+        return result
+
+    def cache_stats(self) -> Dict[str, Any]:
+        with self._counter_lock:
+            hits, misses = self.table_hits, self.table_misses
+        lookups = hits + misses
+        active = self._active
+        return {
+            "model_version": active.version if active is not None else None,
+            "memo": self.memo.stats(),
+            "table": {
+                "loaded": active is not None and active.table is not None,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            },
+            "scheduler": self.scheduler.stats(),
+        }
+
+    def predict_batch(self, rows: List[Dict[str, Any]], model: Optional[ModelVersion] = None) -> List[Dict[str, Any]]:
+        """
+        Predict many students at once: one feature matrix and one predict_proba
+        call for the whole batch. Returns one result per row, in order, all
+        from the same model version (`model`, or the active one).
+        """
+        if not rows:
+            return []
+        model = model or self.active
+        model.ensure_loaded()
+
+        try:
+            features = np.array([[row.get(name, 0) for name in FEATURES] for row in rows], dtype=np.float64)
+            use_forest = model.forest is not None and len(rows) <= FLAT_FOREST_MAX_ROWS
+            estimator = model.forest if use_forest else model.model
+            return _format_predictions(estimator.predict_proba(features), estimator.classes_, model.version)
+        except ModelUnavailableError:
+            raise
         except Exception as e:
-            print(f"Prediction error: {e}")
-            return {"predicted_career": "Processing Error", "probabilities": []}
+            print(f"Batch prediction error: {e}")
+            return [{"predicted_career": "Processing Error", "probabilities": [], "model_version": model.version} for _ in rows]
 
 career_predictor = CareerPredictor()
@@ -0,0 +1,96 @@
+"""
+Local registry of trained career models.
+
+Every model `ml/train_model.py` trains gets its own version directory, and a
+`CURRENT` file names the version the API serves:
+
+    registry/
+        CURRENT                     e.g. "v2"
+        v1/
+            metadata.json           version, trained_at, accuracy, features, classes, model_sha256
+            career_model.pkl
+            career_model_forest.npz
+            career_model_table.npz
+        v2/
+            ...
+
+A version's model is never replaced once written; switching models only rewrites
+CURRENT (atomically), so any worker can follow it.
+"""
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+MODEL_FILE = "career_model.pkl"
+FOREST_FILE = "career_model_forest.npz"
+TABLE_FILE = "career_model_table.npz"
+METADATA_FILE = "metadata.json"
+CURRENT_FILE = "CURRENT"
+
+_VERSION_RE = re.compile(r"^v(\d+)$")
+
+
+class ModelRegistry:
+    """Read side of the registry directory; see module docstring."""
+
+    def __init__(self, root: str = settings.MODEL_REGISTRY_DIR):
+        self.root = root
+
+    def path(self, version: str, name: str = "") -> str:
+        """Path of a version directory (or a file in it); KeyError for unknown versions."""
+        if not _VERSION_RE.match(version or "") or not os.path.isdir(os.path.join(self.root, version)):
+            raise KeyError(version)
+        return os.path.join(self.root, version, name) if name else os.path.join(self.root, version)
+
+    def metadata(self, version: str) -> Dict[str, Any]:
+        try:
+            with open(self.path(version, METADATA_FILE), encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            metadata = {}
+        metadata["version"] = version
+        return metadata
+
+    def versions(self) -> List[str]:
+        """Registered versions, oldest first."""
+        try:
+            entries = os.listdir(self.root)
+        except OSError:
+            return []
+        numbered = [
+            (int(match.group(1)), entry)
+            for entry in entries
+            for match in [_VERSION_RE.match(entry)]
+            if match and os.path.isdir(os.path.join(self.root, entry))
+        ]
+        return [entry for _, entry in sorted(numbered)]
+
+    def current(self) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+        """Active version named by CURRENT, and a stamp that changes whenever CURRENT is rewritten."""
+        path = os.path.join(self.root, CURRENT_FILE)
+        try:
+            st = os.stat(path)
+            stamp = (st.st_ino, st.st_mtime_ns)
+            with open(path, encoding="utf-8") as f:
+                version = f.read().strip()
+        except OSError:
+            return None, None
+        return version or None, stamp
+
+    def set_current(self, version: str) -> None:
+        """Point CURRENT at `version` (replaced atomically)."""
+        self.path(version)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(version + "\n")
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, os.path.join(self.root, CURRENT_FILE))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
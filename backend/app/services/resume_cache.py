@@ -0,0 +1,151 @@
+"""
+Disk cache of resume extraction results, keyed by the SHA-256 of the upload.
+
+Students re-upload the same file while they tweak their profile; a hit skips
+PDF/DOCX parsing and skill matching entirely. Each row records the parser and
+taxonomy versions that produced it and is only served while both are current,
+so a parser change (or a change to the page/saturation limits, which are part
+of the parser version) or a taxonomy edit invalidates old results by itself.
+Results are stored zlib-compressed in a local SQLite file; once they add up to
+more than `max_bytes`, the least recently used rows are evicted.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.resume_parser import PARSER_VERSION
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS extractions (
+    sha256 TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    taxonomy_version TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (sha256, kind)
+);
+CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used);
+"""
+
+Extraction = Tuple[str, List[Dict[str, str]]]
+
+
+def parser_version() -> str:
+    """Parser version plus the settings that change what it extracts."""
+    return f"{PARSER_VERSION}/pages={settings.RESUME_MAX_PAGES}/saturation={settings.RESUME_SKILL_SATURATION}"
+
+
+class ResumeCache:
+    """See module docstring. Cache errors are logged and treated as misses."""
+
+    def __init__(self, path: str = settings.RESUME_CACHE_PATH, max_bytes: int = int(settings.RESUME_CACHE_MB * 1024 * 1024)):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit; WAL lets several server processes share the file
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, sha256: str, kind: str, parser_version: str, taxonomy_version: str) -> Optional[Extraction]:
+        """Cached (text, skills) for this content, or None."""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT payload FROM extractions WHERE sha256 = ? AND kind = ? AND parser_version = ? AND taxonomy_version = ?",
+                    (sha256, kind, parser_version, taxonomy_version),
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE extractions SET last_used = ? WHERE sha256 = ? AND kind = ?", (time.time(), sha256, kind))
+                self.hits += 1
+        except sqlite3.Error as e:
+            print(f"Resume cache lookup failed: {e}")
+            return None
+        payload = json.loads(zlib.decompress(row[0]))
+        return payload["text"], payload["skills"]
+
+    def put(self, sha256: str, kind: str, parser_version: str, taxonomy_version: str, text: str, skills: List[Dict[str, str]]) -> None:
+        if not self.enabled:
+            return
+        payload = zlib.compress(json.dumps({"text": text, "skills": skills}, separators=(",", ":")).encode("utf-8"))
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (sha256, kind, parser_version, taxonomy_version, payload, len(payload), time.time()),
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"Resume cache store failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        excess = conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for sha256, kind, size in conn.execute("SELECT sha256, kind, size FROM extractions ORDER BY last_used"):
+            victims.append((sha256, kind))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM extractions WHERE sha256 = ? AND kind = ?", victims)
+        self.evictions += len(victims)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        stats: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+        if self.enabled:
+            try:
+                with self._lock:
+                    entries, size = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions").fetchone()
+                stats.update(entries=entries, bytes=size)
+            except sqlite3.Error as e:
+                print(f"Resume cache stats failed: {e}")
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+resume_cache = ResumeCache()
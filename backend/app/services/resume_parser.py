@@ -1,81 +1,190 @@
-import re
-from typing import List, Set
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Set, Tuple, Union
 from pypdf import PdfReader
 import io
+import zipfile
+import zlib
 import docx
 
+from app.logic.skill_taxonomy import SkillTaxonomy, skill_taxonomy
+
+# Document bytes, or the path of an upload spooled to disk
+Source = Union[bytes, str]
+
+# Output read per step when sizing a compressed content stream
+INFLATE_CHUNK = 64 * 1024
+
+# Bump when a change here alters the text or skills extracted from a document
+PARSER_VERSION = "1"
+
+
+@contextmanager
+def _open_source(source: Source) -> Iterator[BinaryIO]:
+    if isinstance(source, (bytes, bytearray)):
+        yield io.BytesIO(source)
+    else:
+        # An open file, not the path: pypdf reads a path fully into memory
+        with open(source, "rb") as f:
+            yield f
+
+
+class ResumeTooLargeError(ValueError):
+    """The document has more pages, or expands to more bytes, than allowed."""
+
+
 class ResumeParser:
-    def __init__(self):
-        # Structured skill database with categories and descriptions
+    def __init__(self, taxonomy: SkillTaxonomy = skill_taxonomy):
+        # Canonical skills, aliases, categories and descriptions (app/models_data/skill_taxonomy.json)
+        self.taxonomy = taxonomy
         self.skills_data = {
-            "Python": {"cat": "Technical", "desc": "High-level programming language used for web dev, AI, and automation."},
-            "JavaScript": {"cat": "Technical", "desc": "The primary language of the web, essential for interactive frontends."},
-            "React": {"cat": "Tools & Frameworks", "desc": "Popular JS library for building modern component-based UIs."},
-            "SQL": {"cat": "Technical", "desc": "Standard language for managing and querying relational databases."},
-            "Machine Learning": {"cat": "Technical", "desc": "Teaching computers to learn from data and make predictions."},
-            "Communication": {"cat": "Soft Skills", "desc": "Effectively conveying information to stakeholders and team members."},
-            "Problem Solving": {"cat": "Soft Skills", "desc": "Analytical approach to resolving technical and logical challenges."},
-            "Git": {"cat": "Tools & Frameworks", "desc": "Distributed version control system for tracking source code changes."},
-            "Docker": {"cat": "Tools & Frameworks", "desc": "Containerization platform to package applications with dependencies."},
-            "Figma": {"cat": "Tools & Frameworks", "desc": "Collaborative interface design tool for UX/UI prototyping."},
-            "Leadership": {"cat": "Soft Skills", "desc": "Inspiring and managing team efforts towards a project goal."},
-            "Agile": {"cat": "Soft Skills", "desc": "Iterative project management methodology focused on rapid delivery."},
-            "HTML": {"cat": "Technical", "desc": "Standard markup language for creating the structure of web pages."},
-            "CSS": {"cat": "Technical", "desc": "Styling language used to control the layout and design of web documents."},
-            "NLP": {"cat": "Technical", "desc": "Natural Language Processing for machines to understand human text."},
-            "Adaptability": {"cat": "Soft Skills", "desc": "Adjusting to new environments and changing project requirements."},
-            "Critical Thinking": {"cat": "Soft Skills", "desc": "Rational and unbiased evaluation of information or situations."},
-            "Collaborative": {"cat": "Soft Skills", "desc": "Working effectively with others to achieve shared goals."},
-            "Teamwork": {"cat": "Soft Skills", "desc": "Cooperative effort by the members of a group or team to achieve a common goal."},
-            "Time Management": {"cat": "Soft Skills", "desc": "Ability to use one's time effectively or productively."},
+            skill["name"]: {"cat": skill["category"], "desc": skill["description"]}
+            for skill in taxonomy.skills
         }
         self.skills_db: Set[str] = {s.lower() for s in self.skills_data.keys()}
 
-    def extract_text_from_pdf(self, file_content: bytes) -> str:
-        """Extracts text from a PDF file efficiently with fallback."""
-        try:
-            reader = PdfReader(io.BytesIO(file_content))
-            text = ""
-            for page in reader.pages:
+    @staticmethod
+    def _inflated_size(data: bytes, limit: int) -> int:
+        """Size `data` inflates to, counted in chunks and no further than just past `limit`."""
+        inflater = zlib.decompressobj()
+        size = 0
+        while data and size <= limit:
+            size += len(inflater.decompress(data, INFLATE_CHUNK))
+            data = inflater.unconsumed_tail
+        return size
+
+    @classmethod
+    def _content_size(cls, page, limit: int) -> int:
+        """
+        Decoded size of the page's content streams, counted no further than just
+        past `limit`. Flate streams (nearly all of them) are inflated chunk by
+        chunk without keeping the output, so a decompression bomb is caught
+        before it is in memory; pypdf caps every other decoder's output itself.
+        """
+        contents = page.get("/Contents")
+        if contents is None:
+            return 0
+        contents = contents.get_object()
+        total = 0
+        for stream in contents if isinstance(contents, list) else [contents]:
+            stream = stream.get_object()
+            filters = stream.get("/Filter")
+            filters = [] if filters is None else list(filters) if isinstance(filters, list) else [filters]
+            if not filters:
+                total += len(stream.get_data())
+            elif filters == ["/FlateDecode"]:
+                # pypdf only exposes the encoded bytes as _data
+                try:
+                    total += cls._inflated_size(stream._data, limit - total)
+                except zlib.error:
+                    # Damaged stream: let pypdf's recovering decoder size it
+                    total += len(stream.get_data())
+            else:
+                total += len(stream.get_data())
+            if total > limit:
+                break
+        return total
+
+    def iter_pdf_pages(self, source: Source, max_pages: Optional[int] = None, max_bytes: Optional[int] = None) -> Iterator[str]:
+        """
+        Yields the text of each non-empty page, reading no further than the
+        caller consumes and at most `max_pages` pages. Raises ResumeTooLargeError
+        once page content decompresses past `max_bytes`.
+        """
+        with _open_source(source) as stream:
+            reader = PdfReader(stream)
+            decompressed = 0
+            for number, page in enumerate(reader.pages):
+                if max_pages is not None and number >= max_pages:
+                    return
+                if max_bytes is not None:
+                    decompressed += self._content_size(page, max_bytes - decompressed)
+                    if decompressed > max_bytes:
+                        raise ResumeTooLargeError(f"PDF content expands past {max_bytes} bytes")
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-            return text.strip()
+                    yield page_text
+
+    def iter_docx_paragraphs(self, source: Source, max_bytes: Optional[int] = None) -> Iterator[str]:
+        """Yields each paragraph's text; ResumeTooLargeError if the archive unpacks past `max_bytes`."""
+        with _open_source(source) as stream:
+            if max_bytes is not None:
+                with zipfile.ZipFile(stream) as archive:
+                    unpacked = sum(info.file_size for info in archive.infolist())
+                if unpacked > max_bytes:
+                    raise ResumeTooLargeError(f"DOCX expands to {unpacked} bytes; at most {max_bytes} are accepted")
+                stream.seek(0)
+            for para in docx.Document(stream).paragraphs:
+                yield para.text
+
+    def extract_text_from_pdf(self, file_content: Source, max_pages: Optional[int] = None, max_bytes: Optional[int] = None) -> str:
+        """Extracts text from a PDF file efficiently with fallback (see iter_pdf_pages for the limits)."""
+        try:
+            return "\n".join(self.iter_pdf_pages(file_content, max_pages, max_bytes)).strip()
+        except ResumeTooLargeError:
+            raise
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
 
-    def extract_text_from_docx(self, file_content: bytes) -> str:
-        """Extracts text from a DOCX file."""
+    def extract_text_from_docx(self, file_content: Source, max_bytes: Optional[int] = None) -> str:
+        """Extracts text from a DOCX file (see iter_docx_paragraphs for the limit)."""
         try:
-            doc = docx.Document(io.BytesIO(file_content))
-            text = ""
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-            return text.strip()
+            return "\n".join(self.iter_docx_paragraphs(file_content, max_bytes)).strip()
+        except ResumeTooLargeError:
+            raise
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
 
+    def extract_resume(
+        self,
+        kind: str,
+        source: Source,
+        max_pages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        saturation: Optional[int] = None,
+    ) -> Tuple[str, List[dict[str, str]]]:
+        """
+        Text and skills of a "pdf" or "docx" resume, matched page by page (or
+        paragraph by paragraph) as it is read. Reading stops after `max_pages`
+        pages, or once `saturation` distinct skills have been found.
+        """
+        units = self.iter_pdf_pages(source, max_pages, max_bytes) if kind == "pdf" else self.iter_docx_paragraphs(source, max_bytes)
+        parts: List[str] = []
+        found: Set[int] = set()
+        try:
+            for part in units:
+                parts.append(part)
+                found.update(self.taxonomy.find(part))
+                if saturation and len(found) >= saturation:
+                    break
+        except ResumeTooLargeError:
+            raise
+        except Exception as e:
+            print(f"Error extracting text from {kind.upper()}: {e}")
+            return "", []
+        finally:
+            units.close()
+        return "\n".join(parts).strip(), self._skill_entries(sorted(found))
+
+    def _skill_entries(self, indices: List[int]) -> List[dict[str, str]]:
+        found_skills = []
+
+        for index in indices:
+            skill = self.taxonomy.skills[index]
+            found_skills.append({
+                "name": skill["name"],
+                "category": skill["category"],
+                "description": skill["description"]
+            })
+
+        return found_skills
+
     def extract_skills(self, text: str) -> List[dict[str, str]]:
-        """Extracts skills from the given text using keyword matching with metadata."""
+        """Extracts skills (names or aliases, one pass over the text) with their taxonomy metadata."""
         if not text:
             return []
-            
-        text_lower = text.lower()
-        text_clean = re.sub(r'[^\w\s]', ' ', text_lower)
-        
-        found_skills = []
-        
-        for skill_name, metadata in self.skills_data.items():
-            pattern = r'\b' + re.escape(skill_name.lower()) + r'\b'
-            if re.search(pattern, text_clean):
-                found_skills.append({
-                    "name": skill_name,
-                    "category": metadata["cat"],
-                    "description": metadata["desc"]
-                })
-                
-        return found_skills
+
+        return self._skill_entries(self.taxonomy.find(text))
 
 resume_parser = ResumeParser()
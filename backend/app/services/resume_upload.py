@@ -0,0 +1,100 @@
+"""
+Streaming intake of resume uploads.
+
+`spool_upload` copies an upload in fixed-size chunks, so the API process never
+holds more than `spool_bytes` of it: small uploads stay in memory, larger ones
+go to a temporary file that extraction workers open by path. The SHA-256 of
+the content is computed on the way through. An upload is refused as soon as it
+crosses `max_bytes` (the BodySizeLimit middleware applies the same cap, plus
+room for multipart framing, to the raw request body before the form is even
+parsed).
+"""
+import hashlib
+import os
+import tempfile
+from typing import Optional
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.services.resume_parser import Source
+
+CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """The upload is over the size limit."""
+
+
+class SpooledUpload:
+    """An upload held in memory up to a threshold and in a temporary file past it."""
+
+    def __init__(self, spool_bytes: int, suffix: str = ""):
+        self.spool_bytes = spool_bytes
+        self.suffix = suffix
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._buffer = bytearray()
+        self._file = None
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._digest.update(chunk)
+        if self._file is None and self.size > self.spool_bytes:
+            self._file = tempfile.NamedTemporaryFile(prefix="resume-", suffix=self.suffix, delete=False)
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._buffer += chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def on_disk(self) -> bool:
+        return self._file is not None
+
+    @property
+    def source(self) -> Source:
+        """The upload's bytes, or the path of its temporary file."""
+        if self._file is not None:
+            self._file.flush()
+            return self._file.name
+        return bytes(self._buffer)
+
+    def read(self) -> bytes:
+        if self._file is None:
+            return bytes(self._buffer)
+        self._file.flush()
+        with open(self._file.name, "rb") as f:
+            return f.read()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            os.unlink(self._file.name)
+            self._file = None
+        self._buffer = bytearray()
+
+
+async def spool_upload(upload: UploadFile, max_bytes: Optional[int] = None, spool_bytes: Optional[int] = None) -> SpooledUpload:
+    """Copy `upload` chunk by chunk; UploadTooLargeError once it passes `max_bytes`."""
+    if max_bytes is None:
+        max_bytes = int(settings.RESUME_MAX_UPLOAD_MB * 1024 * 1024)
+    if spool_bytes is None:
+        spool_bytes = settings.RESUME_SPOOL_KB * 1024
+    spooled = SpooledUpload(spool_bytes, suffix=os.path.splitext(upload.filename or "")[1])
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                return spooled
+            if spooled.size + len(chunk) > max_bytes:
+                raise UploadTooLargeError(f"Upload is larger than {max_bytes} bytes")
+            spooled.write(chunk)
+    except BaseException:
+        spooled.close()
+        raise
@@ -0,0 +1,111 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.logic.roadmap_diff import apply_patch, diff
+from app.logic.roadmap_format import compact_roadmap
+from app.models.roadmap import Roadmap, RoadmapRevision
+
+
+def save_roadmap(db: Session, user_id: int, career: str, content: Dict[str, Any]) -> Roadmap:
+    """
+    Persist a freshly generated (compact) roadmap as the user's active one.
+
+    Regenerating for the same career updates the active row in place and keeps
+    only a reverse patch of what changed; a different career archives the old
+    roadmap and starts a new base row. The caller commits.
+    """
+    active = db.query(Roadmap).filter(Roadmap.user_id == user_id, Roadmap.status == "active").first()
+    if active and active.career_path == career:
+        record_revision(db, active, content)
+        return active
+
+    if active:
+        active.status = "archived"
+    roadmap = Roadmap(user_id=user_id, career_path=career, content=content, status="active")
+    db.add(roadmap)
+    return roadmap
+
+
+# Attempts at recording a revision while other requests keep updating the roadmap
+MAX_REVISION_ATTEMPTS = 5
+
+
+class RoadmapConflictError(RuntimeError):
+    """The roadmap kept changing underneath a revision; nothing was recorded."""
+
+
+def current_version(db: Session, roadmap: Roadmap) -> int:
+    return db.query(RoadmapRevision).filter(RoadmapRevision.roadmap_id == roadmap.id).count() + 1
+
+
+def record_revision(db: Session, roadmap: Roadmap, content: Dict[str, Any]) -> Optional[RoadmapRevision]:
+    """
+    Make `content` the latest version, storing the patch back to the previous one.
+
+    The patch is only valid against the content it was computed from, so the
+    roadmap row is updated with a compare-and-swap on `updated_at`: if another
+    request saved a version since `roadmap` was loaded, it is re-read and the
+    patch recomputed. The successful UPDATE holds the row's write lock until
+    the caller commits, so the version number counted after it cannot be taken
+    twice (and the unique constraint on (roadmap_id, version) backs that up).
+    """
+    for _ in range(MAX_REVISION_ATTEMPTS):
+        previous = compact_roadmap(roadmap.content)
+        if previous == content:
+            return None
+
+        ops = diff(content, previous)
+        if len(json.dumps(ops)) > len(json.dumps(previous)):
+            # Unrelated regenerations: a full snapshot is smaller than the patch
+            ops = [{"op": "replace", "path": "", "value": previous}]
+
+        generated_at = roadmap.updated_at or roadmap.created_at
+        swapped = (
+            db.query(Roadmap)
+            .filter(Roadmap.id == roadmap.id, Roadmap.updated_at == roadmap.updated_at)
+            .update({Roadmap.content: content, Roadmap.updated_at: datetime.utcnow()})
+        )
+        if swapped:
+            revision = RoadmapRevision(
+                roadmap_id=roadmap.id,
+                version=current_version(db, roadmap),
+                patch=ops,
+                created_at=generated_at,
+            )
+            db.add(revision)
+            return revision
+        db.refresh(roadmap)
+    raise RoadmapConflictError(f"Roadmap {roadmap.id} changed {MAX_REVISION_ATTEMPTS} times while saving a revision")
+
+
+def list_versions(db: Session, roadmap: Roadmap) -> List[Dict[str, Any]]:
+    revisions = (
+        db.query(RoadmapRevision)
+        .filter(RoadmapRevision.roadmap_id == roadmap.id)
+        .order_by(RoadmapRevision.version)
+        .all()
+    )
+    versions = [{"version": r.version, "created_at": r.created_at} for r in revisions]
+    versions.append({"version": len(revisions) + 1, "created_at": roadmap.updated_at or roadmap.created_at})
+    return versions
+
+
+def reconstruct(db: Session, roadmap: Roadmap, version: int) -> Optional[Any]:
+    """Rebuild `version` of the roadmap by walking reverse patches back from the latest."""
+    latest = current_version(db, roadmap)
+    if version < 1 or version > latest:
+        return None
+
+    content = roadmap.content
+    revisions = (
+        db.query(RoadmapRevision)
+        .filter(RoadmapRevision.roadmap_id == roadmap.id, RoadmapRevision.version >= version)
+        .order_by(RoadmapRevision.version.desc())
+        .all()
+    )
+    for revision in revisions:
+        content = apply_patch(content, revision.patch)
+    return content
@@ -0,0 +1,80 @@
+"""
+Latency of CareerPredictor inference: sklearn's RandomForestClassifier versus
+the flattened NumPy evaluator (FlatForest), for single rows and batches, and
+predict() served from the memo, the prediction table and live inference.
+
+    python -m benchmarks.ml_inference [-o results.json]
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.services.ml_service import FEATURES, PredictionMemo, career_predictor
+
+BATCH_SIZES = (1, 10, 100, 256, 1000)
+
+
+def _time(fn: Callable[[], object], iterations: int) -> Dict[str, float]:
+    fn()
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        timings.append(time.perf_counter_ns() - start)
+    timings.sort()
+    return {
+        "p50_us": round(statistics.median(timings) / 1e3, 2),
+        "p99_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1e3, 2),
+    }
+
+
+def run(iterations: int = 100) -> List[Dict[str, object]]:
+    # Models load lazily: map the active version in before looking at its forest
+    career_predictor.warmup()
+    if career_predictor.forest is None:
+        raise SystemExit("No flattened forest loaded; run: python ml/train_model.py --export-only")
+
+    rng = np.random.default_rng(0)
+    features = np.column_stack([rng.integers(0, 101, (max(BATCH_SIZES), 4)), rng.integers(0, 11, (max(BATCH_SIZES), 3))]).astype(np.float64)
+    row = dict(zip(FEATURES, features[0].tolist()))
+
+    results = []
+    for size in BATCH_SIZES:
+        batch = features[:size]
+        n = max(5, iterations // size) if size > 1 else iterations
+        for engine, estimator in (("sklearn", career_predictor.model), ("flat", career_predictor.forest)):
+            results.append({"op": "predict_proba", "engine": engine, "rows": size, **_time(lambda: estimator.predict_proba(batch), n)})
+    results.append({"op": "CareerPredictor.predict", "engine": "memo", "rows": 1, **_time(lambda: career_predictor.predict(row), iterations)})
+
+    memo = career_predictor.memo
+    career_predictor.memo = PredictionMemo(0)
+    try:
+        on_grid = dict(zip(FEATURES, [40, 70, 20, 90, 3, 4, 5]))
+        off_grid = dict(zip(FEATURES, [41, 73, 22, 91, 3, 4, 5]))
+        results.append({"op": "CareerPredictor.predict", "engine": "table", "rows": 1, **_time(lambda: career_predictor.predict(on_grid), iterations)})
+        results.append({"op": "CareerPredictor.predict", "engine": "live", "rows": 1, **_time(lambda: career_predictor.predict(off_grid), iterations)})
+    finally:
+        career_predictor.memo = memo
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark career model inference.")
+    parser.add_argument("-n", "--iterations", type=int, default=100)
+    parser.add_argument("-o", "--output", help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    for r in results:
+        print(f"{r['op']:<24}{r['engine']:<9}{r['rows']:>6} rows  p50 {r['p50_us']:>10.2f}us  p99 {r['p99_us']:>10.2f}us")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
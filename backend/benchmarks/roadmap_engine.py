@@ -0,0 +1,219 @@
+"""
+Benchmark suite for RoadmapEngine.
+
+Sweeps every career in TEMPLATES against a grid of score profiles, existing
+skill set sizes and confidence values, and reports per case: ops/sec, p50/p99
+latency, allocations per call (tracemalloc: memory blocks a call leaves
+allocated, its result included, and its peak traced bytes) and output payload
+size.
+Results are written as JSON so two commits can be compared:
+
+    python -m benchmarks.roadmap_engine                      # -> benchmarks/results/<commit>.json
+    python -m benchmarks.roadmap_engine --compare benchmarks/results/<older>.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.roadmap_format import compact_roadmap
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+# Calls whose results are kept alive while counting the blocks they allocated
+ALLOC_CALLS = 10
+
+SCORE_PROFILES = {
+    "low": {"programming": 30, "math": 35, "communication": 45, "logic": 30, "design": 20},
+    "mid": {"programming": 60, "math": 55, "communication": 65, "logic": 60, "design": 50},
+    "high": {"programming": 95, "math": 90, "communication": 88, "logic": 92, "design": 90},
+    "mixed": {"programming": 90, "math": 35, "communication": 70, "logic": 55, "design": 10},
+}
+SKILL_COUNTS = (0, 10, 50, 200)
+CONFIDENCES = (0.5, 0.9)
+
+
+def _skill_vocabulary(engine: RoadmapEngine) -> List[str]:
+    # Real template skills mixed with resume-style noise, like parsed resumes
+    vocabulary = {step["skill"] for template in engine.TEMPLATES.values() for steps in template.values() for step in steps}
+    vocabulary.update(engine.SKILL_DETAILS)
+    vocabulary.update(f"tool-{i}" for i in range(200))
+    return sorted(vocabulary)
+
+
+def _measure(fn: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    fn()  # warm lazily built per-career state
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        fn()
+        timings.append(time.perf_counter_ns() - start)
+    timings.sort()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [fn() for _ in range(ALLOC_CALLS)]
+    blocks = sum(stat.count_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    del kept
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(iterations / (sum(timings) / 1e9), 1),
+        "p50_us": round(statistics.median(timings) / 1e3, 2),
+        "p99_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] / 1e3, 2),
+        "alloc_blocks_per_call": round(blocks / ALLOC_CALLS, 1),
+        "peak_bytes_per_call": peak,
+    }
+
+
+def run(iterations: int = 200, careers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    engine = RoadmapEngine()
+    vocabulary = _skill_vocabulary(engine)
+    rng = random.Random(42)
+    results = []
+
+    for career in careers or list(engine.TEMPLATES):
+        for profile_name, scores in SCORE_PROFILES.items():
+            for skill_count in SKILL_COUNTS:
+                skills = rng.sample(vocabulary, min(skill_count, len(vocabulary)))
+                for confidence in CONFIDENCES:
+                    case = {"career": career, "profile": profile_name, "skills": skill_count, "confidence": confidence}
+                    roadmap = engine._build_roadmap(career, scores, skills, confidence)
+                    payload = {
+                        "payload_bytes": len(json.dumps(roadmap)),
+                        "payload_v2_bytes": len(json.dumps(compact_roadmap(roadmap))),
+                    }
+                    cases = {
+                        # Uncached build (alias normalization included), i.e. a cache miss in generate()
+                        "generate_cold": lambda: engine._build_roadmap(career, scores, skills, confidence),
+                        "generate_cached": lambda: engine.generate(career, scores, skills, confidence),
+                    }
+                    for op, fn in cases.items():
+                        results.append({"op": op, **case, **_measure(fn, iterations), **payload})
+
+            # Independent of skills / confidence: once per (career, profile)
+            for phase_name in engine.TEMPLATES[career]:
+                fn = lambda: engine._get_phase_metadata(career, phase_name, scores)
+                results.append({"op": "phase_metadata", "career": career, "profile": profile_name, "phase": phase_name, **_measure(fn, iterations)})
+
+        for skill_count in SKILL_COUNTS:
+            skills = engine.CAREER_REQUIRED_SKILLS.get(career, []) + rng.sample(vocabulary, min(skill_count, len(vocabulary)))
+            fn = lambda: engine.get_projects_for_skills(career, skills)
+            results.append({"op": "projects_for_skills", "career": career, "skills": skill_count, **_measure(fn, iterations)})
+
+    return results
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Per-operation medians over all cases, the numbers compared between commits."""
+    summary = {}
+    for op in sorted({r["op"] for r in results}):
+        rows = [r for r in results if r["op"] == op]
+        summary[op] = {
+            "cases": len(rows),
+            "p50_us": round(statistics.median(r["p50_us"] for r in rows), 2),
+            "p99_us": round(statistics.median(r["p99_us"] for r in rows), 2),
+            "ops_per_sec": round(statistics.median(r["ops_per_sec"] for r in rows), 1),
+            "alloc_blocks_per_call": round(statistics.median(r["alloc_blocks_per_call"] for r in rows), 1),
+            "peak_bytes_per_call": int(statistics.median(r["peak_bytes_per_call"] for r in rows)),
+        }
+        if "payload_bytes" in rows[0]:
+            summary[op]["payload_bytes"] = int(statistics.median(r["payload_bytes"] for r in rows))
+            summary[op]["payload_v2_bytes"] = int(statistics.median(r["payload_v2_bytes"] for r in rows))
+    return summary
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# alloc_peak_bytes: older result files, so they still match cases by parameters
+METRICS = ("ops_per_sec", "p50_us", "p99_us", "alloc_blocks_per_call", "peak_bytes_per_call", "alloc_peak_bytes", "payload_bytes", "payload_v2_bytes")
+
+
+def _case_key(result: Dict[str, Any]) -> tuple:
+    return tuple(sorted((k, v) for k, v in result.items() if k not in METRICS))
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> bool:
+    """
+    Print the median per-case p50 change for each operation against `baseline`,
+    matching cases by their parameters; return True if any op regressed past `threshold`.
+    """
+    before = {_case_key(r): r for r in baseline["results"]}
+    ratios: Dict[str, List[float]] = {}
+    for result in current["results"]:
+        old = before.get(_case_key(result))
+        if old and old["p50_us"]:
+            ratios.setdefault(result["op"], []).append(result["p50_us"] / old["p50_us"])
+
+    regressed = False
+    print(f"{'operation':<22}{'cases':>7}{'p50 change':>12}")
+    for op, op_ratios in sorted(ratios.items()):
+        ratio = statistics.median(op_ratios)
+        flag = ""
+        if ratio > threshold:
+            regressed = True
+            flag = "  REGRESSION"
+        print(f"{op:<22}{len(op_ratios):>7}{(ratio - 1) * 100:>+11.1f}%{flag}")
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RoadmapEngine across careers and score profiles.")
+    parser.add_argument("-o", "--output", help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("-n", "--iterations", type=int, default=200, help="Timed calls per case")
+    parser.add_argument("--career", action="append", help="Limit to these careers (repeatable)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.10, help="p50 ratio counted as a regression (default 1.10)")
+    args = parser.parse_args(argv)
+
+    commit = _git_commit()
+    started = time.perf_counter()
+    results = run(args.iterations, args.career)
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "catalog_hash": RoadmapEngine().catalog_hash,
+        },
+        "summary": summarize(results),
+        "results": results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for op, row in report["summary"].items():
+        print(f"{op:<22}p50 {row['p50_us']:>9.2f}us  p99 {row['p99_us']:>9.2f}us  {row['ops_per_sec']:>10.1f} ops/s  {row['alloc_blocks_per_call']:>8.1f} blocks  peak {row['peak_bytes_per_call']:>8} B")
+    print(f"{len(results)} cases in {time.perf_counter() - started:.1f}s -> {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(baseline, report, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import zlib
+
+import pytest
+
+from app.logic import catalog_source
+from app.logic import catalog
+from app.logic.catalog import SECTIONS, RoadmapCatalog, build_catalog, load_catalog
+from app.logic.roadmap_engine import RoadmapEngine
+
+
+def test_compiled_catalog_matches_source(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    content_hash = build_catalog(path)
+    catalog = RoadmapCatalog(path)
+
+    assert catalog.content_hash == content_hash
+    for name in SECTIONS:
+        section = catalog.section(name)
+        source = getattr(catalog_source, name)
+        assert list(section) == list(source)
+        assert {key: section[key] for key in section} == source
+
+
+def test_stale_bundled_catalog_is_compiled_in_memory_not_rewritten(tmp_path, monkeypatch):
+    path = str(tmp_path / "roadmap_catalog.db")
+    content_hash = build_catalog(path)
+    with open(path, "rb") as f:
+        built = f.read()
+    # An edited source makes the bundled artifact stale
+    source = tmp_path / "catalog_source.py"
+    source.write_text(open(catalog.SOURCE_PATH).read() + "\n# edited\n")
+    monkeypatch.setattr(catalog, "BUNDLED_CATALOG_PATH", path)
+    monkeypatch.setattr(catalog, "SOURCE_PATH", str(source))
+
+    loaded = load_catalog(path)
+
+    assert loaded.content_hash == content_hash
+    assert loaded.section("TEMPLATES")["UI/UX Designer"] == catalog_source.TEMPLATES["UI/UX Designer"]
+    with open(path, "rb") as f:
+        assert f.read() == built
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["catalog_source.py", "roadmap_catalog.db"]
+
+
+def test_engine_decodes_only_the_requested_career(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    build_catalog(path)
+    engine = RoadmapEngine(catalog=RoadmapCatalog(path))
+
+    engine.generate("UI/UX Designer", {}, ["figma"], confidence=0.5)
+
+    assert list(engine.catalog.section("TEMPLATES")._loaded) == ["UI/UX Designer"]
+    assert list(engine._snapshot.step_matchers) == ["UI/UX Designer"]
+
+
+def test_reload_swaps_catalog_only_when_content_changes(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    old_hash = build_catalog(path)
+    engine = RoadmapEngine(catalog_path=path)
+    before = engine.generate("Software Engineer", {}, [], confidence=0.5)
+
+    assert engine.reload_catalog()["changed"] is False
+
+    with sqlite3.connect(path) as conn:
+        (payload,) = conn.execute("SELECT payload FROM entries WHERE section = 'TEMPLATES' AND key = 'Software Engineer'").fetchone()
+        template = json.loads(zlib.decompress(payload))
+        template["Phase 1 – Foundations"][0]["title"] = "Edited title"
+        conn.execute("UPDATE entries SET payload = ? WHERE section = 'TEMPLATES' AND key = 'Software Engineer'", (zlib.compress(json.dumps(template).encode()),))
+        conn.execute("UPDATE meta SET value = 'edited' WHERE key = 'content_hash'")
+
+    result = engine.reload_catalog()
+
+    assert result == {"content_hash": "edited", "previous_hash": old_hash, "changed": True}
+    after = engine.generate("Software Engineer", {}, [], confidence=0.5)
+    assert after[0]["steps"][0]["title"] == "Edited title"
+    assert before[0]["steps"][0]["title"] != "Edited title"
+
+
+def test_reload_closes_old_catalog_after_last_request(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    build_catalog(path)
+    engine = RoadmapEngine(catalog_path=path)
+    in_flight = engine._snapshot
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE meta SET value = 'edited' WHERE key = 'content_hash'")
+
+    assert engine.reload_catalog()["changed"] is True
+
+    # Still open for the request that started on it
+    assert in_flight.entry("TEMPLATES", "Data Scientist")
+    old_conn = in_flight.catalog._conn
+    del in_flight
+    with pytest.raises(sqlite3.ProgrammingError):
+        old_conn.execute("SELECT 1")
@@ -0,0 +1,55 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services.cohort_service import CohortPool, count_csv_rows, predict_rows, read_csv_rows, run_cohort
+
+CSV = """math_score,programming_score,communication_score,problem_solving_score,interest_coding,interest_design,interest_management
+90,95,60,88,9,2,3
+55,60,92,70,3,4,9
+not-a-number,60,92,70,3,4,9
+70,40,65,75,2,9,4
+"""
+
+
+def test_run_cohort_streams_results_in_input_order():
+    progress = []
+    results = list(run_cohort(
+        read_csv_rows(CSV.splitlines()), workers=2, chunk_size=1, total=4,
+        on_progress=lambda done, total: progress.append((done, total)),
+    ))
+
+    assert [r["row"] for r in results] == [1, 2, 3, 4]
+    assert "error" in results[2]
+    assert results[0]["roadmap"]["format_version"] == 2
+    assert progress[-1] == (4, 4)
+
+
+def test_count_matches_rows_streamed_from_shared_pool():
+    # Blank lines are skipped and a quoted field spans two lines
+    csv_text = CSV.replace("\n55,", "\n\n55,") + '80,80,80,80,5,5,"5\n"\n\n'
+    lines = csv_text.splitlines()
+    pool = CohortPool(1)
+    try:
+        results = list(run_cohort(read_csv_rows(lines), workers=1, pool=pool))
+        again = list(run_cohort(read_csv_rows(lines), workers=1, pool=pool))
+    finally:
+        pool.shutdown()
+
+    assert count_csv_rows(lines) == len(results) == 5
+    assert [r["row"] for r in again] == [1, 2, 3, 4, 5]
+
+
+def test_cohort_pool_replaces_a_broken_executor():
+    rows = list(enumerate(read_csv_rows(CSV.splitlines()), 1))
+    pool = CohortPool(1)
+    try:
+        # A worker dying mid-task breaks the executor it belongs to
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result()
+        results = pool.submit(predict_rows, rows[:1]).result()
+    finally:
+        pool.shutdown()
+
+    assert results[0]["row"] == 1
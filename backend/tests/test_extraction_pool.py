@@ -0,0 +1,90 @@
+import io
+import threading
+import time
+import tracemalloc
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from app.services.extraction_pool import ExtractionBusyError, ExtractionPool, ExtractionTimeoutError, extract_resume
+from app.services.resume_parser import ResumeTooLargeError, resume_parser
+
+
+def _pdf(pages):
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for text in pages:
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject({NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})})
+        stream = DecodedStreamObject()
+        stream.set_data(b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET")
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def test_extract_resume_stops_early_and_enforces_size_limit():
+    pdf = _pdf(["Python and SQL", "Figma", "Docker"])
+
+    text, skills = extract_resume("pdf", pdf, max_pages=2, max_bytes=1000)
+    assert text == "Python and SQL\nFigma"
+    assert [s["name"] for s in skills] == ["Python", "SQL", "Figma"]
+    # Two skills found on page one: no need to read on
+    assert extract_resume("pdf", pdf, saturation=2)[0] == "Python and SQL"
+    with pytest.raises(ResumeTooLargeError):
+        extract_resume("pdf", pdf, max_bytes=60)
+
+
+def test_compressed_content_is_sized_without_inflating_it():
+    writer = PdfWriter()
+    page = writer.add_blank_page(612, 792)
+    # 200 MB of spaces, about 200 KB compressed
+    bomb = DecodedStreamObject()
+    bomb.set_data(b" " * (200 << 20))
+    page[NameObject("/Contents")] = writer._add_object(bomb.flate_encode())
+    out = io.BytesIO()
+    writer.write(out)
+    del bomb
+
+    tracemalloc.start()
+    try:
+        with pytest.raises(ResumeTooLargeError):
+            extract_resume("pdf", out.getvalue(), max_bytes=1 << 20)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 << 20
+
+
+def test_pool_times_out_and_rejects_past_queue_limit():
+    pool = ExtractionPool(workers=1, timeout=0.5, max_queue=0)
+    try:
+        assert pool.extract("pdf", _pdf(["Docker"])) == ("Docker", [resume_parser.extract_skills("Docker")[0]])
+        with pytest.raises(ResumeTooLargeError):
+            pool.run(extract_resume, "pdf", _pdf(["a", "b"]), None, 10)
+
+        # A hung job costs one timeout; its worker is replaced
+        with pytest.raises(ExtractionTimeoutError):
+            pool.run(time.sleep, 5)
+        assert pool.stats()["idle"] == 0
+
+        # With the only worker busy and no queue, the next job is turned away
+        busy = threading.Thread(target=pool.run, args=(time.sleep, 0.3))
+        busy.start()
+        while pool.stats()["busy"] == 0:
+            time.sleep(0.01)
+        with pytest.raises(ExtractionBusyError):
+            pool.run(time.sleep, 0)
+        busy.join()
+
+        stats = pool.stats()
+        assert (stats["completed"], stats["failed"], stats["timed_out"], stats["rejected"]) == (2, 1, 1, 1)
+        assert (stats["busy"], stats["idle"], stats["queued"]) == (0, 1, 0)
+    finally:
+        pool.shutdown()
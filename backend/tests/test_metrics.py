@@ -0,0 +1,51 @@
+import contextvars
+import threading
+
+from app.core import metrics
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = metrics.LatencyHistogram()
+    for ms in [0.05] * 90 + [3.0] * 9 + [8000.0]:
+        histogram.observe(ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["p50_ms"] == 0.1
+    assert snapshot["p95_ms"] == 5
+    assert snapshot["p99_ms"] == 5
+    assert snapshot["max_ms"] == 8000.0
+    assert snapshot["buckets"]["0.1"] == 90 and snapshot["buckets"]["+Inf"] == 100
+
+
+def test_stages_are_collected_per_request_and_across_threads():
+    # Outside a request, stages are not recorded anywhere
+    with metrics.stage("inference"):
+        pass
+
+    def request():
+        timer = metrics.start_request()
+        with metrics.stage("features"):
+            pass
+        # Worker threads started with the request's context report into the same timer
+        context = contextvars.copy_context()
+        worker = threading.Thread(target=context.run, args=(lambda: metrics.label(model_version="v1", career="Data Scientist"),))
+        worker.start()
+        worker.join()
+        with metrics.stage("inference"):
+            pass
+        return timer
+
+    timer = contextvars.copy_context().run(request)
+    stages = timer.finish()
+
+    assert list(stages) == ["features", "inference", "other", "total"]
+    assert stages["total"] >= stages["features"] + stages["inference"]
+    assert timer.labels == {"model_version": "v1", "career": "Data Scientist"}
+
+    registry = metrics.StageMetrics()
+    registry.observe("/api/predict-career", stages, timer.labels)
+    entries = registry.snapshot(stage="inference", career="Data Scientist")
+    assert [(e["route"], e["model_version"], e["count"]) for e in entries] == [("/api/predict-career", "v1", 1)]
+    assert registry.snapshot(career="UX Designer") == []
+    assert "inference;dur=" in metrics.server_timing(stages)
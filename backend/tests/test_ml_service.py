@@ -0,0 +1,234 @@
+import os
+import random
+import shutil
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import ml_service
+from app.services.ml_service import FEATURES, CareerPredictor, FlatForest, InferenceScheduler, ModelUnavailableError, _load_arrays, career_predictor
+
+
+def _random_rows(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {name: rng.randint(0, 10) if name.startswith("interest_") else rng.randint(0, 100) for name in FEATURES}
+        for _ in range(count)
+    ]
+
+
+def test_predict_batch_matches_the_forest():
+    rows = _random_rows(50)
+    features = np.array([[row[name] for name in FEATURES] for row in rows], dtype=np.float64)
+    expected_classes = career_predictor.model.predict(features)
+    expected_probabilities = career_predictor.model.predict_proba(features)
+
+    results = career_predictor.predict_batch(rows)
+
+    for result, expected_class, expected in zip(results, expected_classes, expected_probabilities):
+        assert result["predicted_career"] == expected_class
+        assert result["confidence"] == expected.max()
+        by_name = dict(zip(career_predictor.model.classes_, expected))
+        assert [p["prob"] for p in result["probabilities"]] == sorted((round(float(by_name[p["name"]]) * 100, 2) for p in result["probabilities"]), reverse=True)
+    assert career_predictor.predict_batch([]) == []
+
+
+def test_predict_is_a_single_row_batch():
+    row = _random_rows(1, seed=1)[0]
+
+    assert career_predictor.predict(row) == career_predictor.predict_batch([row])[0]
+
+
+def test_flattened_forest_matches_sklearn():
+    forest = career_predictor.forest
+    assert forest is not None, "run: python ml/train_model.py --export-only"
+
+    rng = np.random.default_rng(0)
+    integers = np.column_stack([rng.integers(-5, 120, (500, 4)), rng.integers(-1, 12, (500, 3))]).astype(np.float64)
+    fractions = rng.uniform(0, 100, (500, len(FEATURES)))
+    for features in (integers, fractions, integers[:1]):
+        assert np.array_equal(forest.predict_proba(features), career_predictor.model.predict_proba(features))
+    assert list(forest.classes_) == list(career_predictor.model.classes_)
+
+
+def test_prediction_table_hits_match_live_inference():
+    table = career_predictor.table
+    assert table is not None, "run: python ml/train_model.py --export-only"
+
+    hits = 0
+    for row in _random_rows(300, seed=2) + [{name: 50 for name in FEATURES}]:
+        values = [row[name] for name in FEATURES]
+        raw = table.lookup(values)
+        if raw is not None:
+            hits += 1
+            assert np.array_equal(raw, career_predictor.model.predict_proba(np.array([values], dtype=np.float64))[0])
+    assert hits > 0
+    # Scores between grid bins are off the table
+    assert table.lookup([73, 73, 73, 73, 5, 5, 5]) is None
+
+
+def test_predict_memoizes_exact_inputs():
+    row = {name: 77 for name in FEATURES}
+    before = career_predictor.memo.stats()["hits"]
+
+    first = career_predictor.predict(row)
+    second = career_predictor.predict(dict(row))
+
+    assert second is first
+    assert career_predictor.memo.stats()["hits"] == before + 1
+    assert first == career_predictor.predict_batch([row])[0]
+
+
+def test_scheduler_batches_concurrent_rows_without_changing_results():
+    rows = _random_rows(40, seed=3)
+    scheduler = InferenceScheduler(career_predictor.predict_batch, max_batch=16, max_wait=0.05)
+
+    futures = [scheduler.submit(row) for row in rows]
+
+    assert [f.result(timeout=5) for f in futures] == career_predictor.predict_batch(rows)
+    assert scheduler.stats()["batches"] < len(rows)
+
+
+def test_predict_falls_back_when_scheduler_stalls(monkeypatch):
+    row = _random_rows(1, seed=11)[0]
+    expected = career_predictor.predict_batch([row])[0]
+    release = threading.Event()
+
+    def stalled_batch(rows, model):
+        release.wait(5)
+        return career_predictor.predict_batch(rows, model)
+
+    scheduler = InferenceScheduler(stalled_batch, max_batch=16, max_wait=0.001)
+    scheduler.TIMEOUT_GRACE = 0.1
+    monkeypatch.setattr(career_predictor, "scheduler", scheduler)
+    monkeypatch.setattr(career_predictor.active, "table", None)
+    monkeypatch.setattr(career_predictor.memo, "get", lambda key: None)
+    try:
+        assert career_predictor.predict(dict(row)) == expected
+        assert scheduler.stats()["timeouts"] == 1
+    finally:
+        release.set()
+
+
+class _LoopCrash(BaseException):
+    pass
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_scheduler_restarts_a_dead_loop_and_skips_cancelled_rows():
+    rows = _random_rows(2, seed=12)
+    expected = career_predictor.predict_batch(rows)
+    crashed = []
+
+    def crashing_batch(batch, model):
+        if not crashed:
+            crashed.append(True)
+            raise _LoopCrash()
+        return career_predictor.predict_batch(batch, model)
+
+    scheduler = InferenceScheduler(crashing_batch, max_batch=16, max_wait=0.001)
+    scheduler.submit(rows[0])
+    scheduler._thread.join(5)
+    assert not scheduler._thread.is_alive()
+
+    scheduler.max_wait = 0.05
+    cancelled = scheduler.submit(rows[0])
+    cancelled.cancel()
+    assert scheduler.submit(rows[1]).result(timeout=5) == expected[1]
+    assert scheduler._thread.is_alive()
+
+
+def test_predictor_loads_lazily_from_memory_maps(tmp_path):
+    predictor = CareerPredictor()
+    assert predictor.forest is None and predictor.active._model is None
+
+    predictor.warmup()
+
+    assert isinstance(predictor.forest.value, np.memmap)
+    assert isinstance(predictor.forest.children, np.memmap)
+    assert isinstance(predictor.table.index, np.memmap)
+    # Single rows never need the sklearn pickle
+    assert predictor.active._model is None
+
+    missing = CareerPredictor(registry_dir=str(tmp_path))
+    with pytest.raises(ModelUnavailableError):
+        missing.predict({name: 50 for name in FEATURES})
+
+
+def test_activate_swaps_model_versions(tmp_path, monkeypatch):
+    source = career_predictor.registry.path(career_predictor.model_version)
+    for version in ("v1", "v2"):
+        shutil.copytree(source, tmp_path / version, ignore=shutil.ignore_patterns("*.mmap"))
+    (tmp_path / "CURRENT").write_text("v1\n")
+    predictor = CareerPredictor(registry_dir=str(tmp_path))
+    worker = CareerPredictor(registry_dir=str(tmp_path))
+    row = {name: 64 for name in FEATURES}
+
+    in_flight = predictor.active
+    assert predictor.predict(row)["model_version"] == "v1"
+    assert worker.model_version == "v1"
+
+    assert predictor.activate("v2") == {"model_version": "v2", "previous_version": "v1", "changed": True}
+    assert predictor.predict(row)["model_version"] == "v2"
+    # A request that captured the old version finishes on it
+    assert predictor.predict_batch([row], in_flight)[0]["model_version"] == "v1"
+    assert (tmp_path / "CURRENT").read_text().strip() == "v2"
+    assert [(m["version"], m["active"]) for m in predictor.list_models()] == [("v1", False), ("v2", True)]
+
+    with pytest.raises(KeyError):
+        predictor.activate("v3")
+    assert predictor.model_version == "v2"
+
+    # Other workers pick up the new CURRENT in the background
+    monkeypatch.setattr(settings, "MODEL_POLL_SECONDS", 0.001)
+    deadline = time.monotonic() + 5
+    while worker.model_version != "v2" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert worker.model_version == "v2"
+
+
+def test_unpacking_a_new_export_removes_old_copies(tmp_path):
+    path = str(tmp_path / "career_model_forest.npz")
+    np.savez(path, value=np.zeros(3))
+    assert _load_arrays(path)["value"].tolist() == [0, 0, 0]
+
+    # Re-exported in place: new content, new digest
+    np.savez(path, value=np.ones(3))
+    assert _load_arrays(path)["value"].tolist() == [1, 1, 1]
+
+    assert len([p for p in tmp_path.iterdir() if p.name.endswith(".mmap")]) == 1
+
+
+def test_fallback_unpacks_keep_registry_versions_apart(tmp_path, monkeypatch):
+    unpack = ml_service._unpack
+
+    def read_only_model_dir(path, directory, name):
+        if directory == os.path.dirname(path):
+            raise PermissionError(directory)
+        unpack(path, directory, name)
+
+    monkeypatch.setattr(ml_service, "_unpack", read_only_model_dir)
+    monkeypatch.setattr(ml_service.tempfile, "gettempdir", lambda: str(tmp_path / "tmp"))
+    paths = []
+    for version, value in (("v1", 0), ("v2", 1)):
+        (tmp_path / version).mkdir()
+        paths.append(str(tmp_path / version / "career_model_forest.npz"))
+        np.savez(paths[-1], value=np.full(3, value))
+
+    v1 = _load_arrays(paths[0])
+    assert _load_arrays(paths[1])["value"].tolist() == [1, 1, 1]
+    # Loading v2 left v1's copy alone
+    assert _load_arrays(paths[0])["value"].tolist() == v1["value"].tolist() == [0, 0, 0]
+    assert len(list((tmp_path / "tmp").rglob("*.mmap"))) == 2
+
+
+def test_flat_forest_reads_exports_without_children():
+    arrays = dict(np.load(career_predictor.active.forest_path))
+    children = arrays.pop("children")
+    old_format = FlatForest({**arrays, "left": children[1::2], "right": children[0::2]})
+    features = np.array([[float(v) for v in row.values()] for row in _random_rows(20, seed=4)])
+
+    assert np.array_equal(old_format.predict_proba(features), FlatForest(dict(np.load(career_predictor.active.forest_path))).predict_proba(features))
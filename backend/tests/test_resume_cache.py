@@ -0,0 +1,36 @@
+import time
+
+from app.services.resume_cache import ResumeCache
+
+SKILLS = [{"name": "Python", "category": "Technical", "description": "..."}]
+
+
+def test_hits_only_for_same_content_parser_and_taxonomy(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache.db"), max_bytes=1 << 20)
+    cache.put("abc", "pdf", "1", "t1", "Python dev", SKILLS)
+
+    assert cache.get("abc", "pdf", "1", "t1") == ("Python dev", SKILLS)
+    assert cache.get("abc", "docx", "1", "t1") is None
+    assert cache.get("abc", "pdf", "2", "t1") is None
+    assert cache.get("abc", "pdf", "1", "t2") is None
+    # Survives a restart
+    assert ResumeCache(cache.path, max_bytes=1 << 20).get("abc", "pdf", "1", "t1") == ("Python dev", SKILLS)
+    assert (cache.stats()["hits"], cache.stats()["misses"], cache.stats()["entries"]) == (1, 3, 1)
+
+
+def test_evicts_least_recently_used_past_size_limit(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache.db"), max_bytes=1 << 20)
+    cache.put("a", "pdf", "1", "t", "first", SKILLS)
+    entry_size = cache.stats()["bytes"]
+    cache.max_bytes = entry_size * 2
+    time.sleep(0.01)
+    cache.put("b", "pdf", "1", "t", "other", SKILLS)
+    time.sleep(0.01)
+    assert cache.get("a", "pdf", "1", "t") is not None  # "b" is now the least recently used
+
+    time.sleep(0.01)
+    cache.put("c", "pdf", "1", "t", "third", SKILLS)
+
+    assert cache.get("b", "pdf", "1", "t") is None
+    assert cache.get("a", "pdf", "1", "t") is not None and cache.get("c", "pdf", "1", "t") is not None
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,55 @@
+import asyncio
+import io
+import os
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.core.body_limit import BodySizeLimit
+from app.services.resume_upload import UploadTooLargeError, spool_upload
+
+
+def _spool(data, **limits):
+    return asyncio.run(spool_upload(UploadFile(io.BytesIO(data), filename="cv.pdf"), **limits))
+
+
+def test_spool_upload_moves_to_disk_past_threshold():
+    small = _spool(b"a" * 100, max_bytes=1000, spool_bytes=200)
+    assert not small.on_disk and small.source == b"a" * 100
+    small.close()
+
+    large = _spool(b"b" * 500, max_bytes=1000, spool_bytes=200)
+    path = large.source
+    assert large.on_disk and path.endswith(".pdf") and large.read() == b"b" * 500
+    large.close()
+    assert not os.path.exists(path)
+
+    with pytest.raises(UploadTooLargeError):
+        _spool(b"c" * 1001, max_bytes=1000, spool_bytes=200)
+
+
+def test_body_size_limit_cuts_off_streamed_uploads():
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    app.add_middleware(BodySizeLimit, limits={"/upload": 4096})
+    client = TestClient(app)
+
+    assert client.post("/upload", files={"file": ("a.txt", b"x" * 1000)}).json() == {"size": 1000}
+    # The cap is on the file; multipart framing around it does not count against it
+    assert client.post("/upload", files={"file": ("a.txt", b"x" * 4096)}).json() == {"size": 4096}
+    too_large = 4096 + BodySizeLimit.MULTIPART_OVERHEAD + 1
+    assert client.post("/upload", files={"file": ("a.txt", b"x" * too_large)}).status_code == 413
+
+    def chunked():
+        yield b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\n'
+        for _ in range(10):
+            yield b"x" * 1024
+        yield b"\r\n--b--\r\n"
+
+    response = client.post("/upload", content=chunked(), headers={"content-type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413
@@ -0,0 +1,33 @@
+import json
+
+from app.logic.roadmap_diff import apply_patch, diff
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.roadmap_format import compact_roadmap
+
+
+def _compact(engine, scores, skills):
+    return json.loads(json.dumps(compact_roadmap(engine.generate("Software Engineer", scores, skills, confidence=0.5))))
+
+
+def test_regeneration_patch_touches_only_changed_steps():
+    engine = RoadmapEngine()
+    before = _compact(engine, {"programming": 70}, [])
+    after = _compact(engine, {"programming": 70}, ["git"])
+
+    ops = diff(after, before)
+
+    assert apply_patch(after, ops) == before
+    assert apply_patch(before, diff(before, after)) == after
+    assert all(op["path"].startswith("/phases/") for op in ops)
+    assert len(json.dumps(ops)) * 10 < len(json.dumps(before))
+
+
+def test_patch_paths_escape_keys():
+    old = {"UI/UX Designer": {"a~b": [1, 2, 3]}}
+    new = {"UI/UX Designer": {"a~b": [1]}, "extra": None}
+
+    ops = diff(old, new)
+
+    assert {"op": "remove", "path": "/UI~1UX Designer/a~0b/2"} in ops
+    assert apply_patch(old, ops) == new
+    assert old == {"UI/UX Designer": {"a~b": [1, 2, 3]}}
@@ -0,0 +1,52 @@
+from app.logic.roadmap_engine import RoadmapEngine
+
+
+def test_generate_is_memoized_per_score_bucket():
+    engine = RoadmapEngine()
+    first = engine.generate("Software Engineer", {"programming": 70, "math": 65}, ["Git"], confidence=0.6)
+    # Same buckets (60-85), same skill set and ambition flag -> shared entry
+    second = engine.generate("Software Engineer", {"programming": 80, "math": 61}, ["git"], confidence=0.7)
+
+    assert second is first
+    stats = engine.cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_cache_key_respects_thresholds():
+    engine = RoadmapEngine()
+    normal = engine.generate("Software Engineer", {"programming": 60}, [], confidence=0.5)
+    remedial = engine.generate("Software Engineer", {"programming": 39}, [], confidence=0.5)
+    ambitious = engine.generate("Software Engineer", {"programming": 60}, [], confidence=0.9)
+
+    assert normal is not remedial and normal is not ambitious
+    assert remedial[0]["steps"][0]["title"] == "Remedial: Coding Basics"
+    assert normal == engine._build_roadmap("Software Engineer", {"programming": 60}, [], 0.5)
+
+
+def test_cache_evicts_least_recently_used():
+    engine = RoadmapEngine(cache_size=2)
+    for career in ("Software Engineer", "Data Scientist", "Web Developer"):
+        engine.generate(career, {}, [], confidence=0.5)
+
+    stats = engine.cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_phase_metadata_is_precomputed_per_career_and_phase():
+    engine = RoadmapEngine()
+    weak = engine._get_phase_metadata("Data Scientist", "Phase 2 – Core Skills", {"math": 45})
+    strong = engine._get_phase_metadata("Data Scientist", "Phase 2 – Core Skills", {"math": 95})
+
+    assert weak["tools"] is strong["tools"]
+    assert weak["resources"] is strong["resources"]
+    assert weak["improvement_areas"] == ["Improve mathematical foundations — focus on applied math"]
+    assert strong["improvement_areas"][0] == "Continue building on your strengths"
+
+
+def test_phase_metadata_for_career_outside_templates():
+    engine = RoadmapEngine()
+    meta = engine._get_phase_metadata("General Analyst", "Phase 1 – Foundations")
+
+    assert "General Analyst" in meta["description"]
+    assert [t["name"] for t in meta["tools"]] == ["VS Code", "Git"]
@@ -0,0 +1,32 @@
+import json
+
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.roadmap_format import compact_roadmap, expand_roadmap, is_compact
+
+
+def test_compact_round_trips_through_json():
+    engine = RoadmapEngine()
+    roadmap = engine.generate("Data Scientist", {"math": 30, "programming": 90}, ["python"], confidence=0.9)
+
+    stored = json.loads(json.dumps(compact_roadmap(roadmap)))
+
+    assert is_compact(stored)
+    assert expand_roadmap(stored, engine.SKILL_DETAILS) == roadmap
+
+
+def test_compact_payload_shares_catalog_entries():
+    engine = RoadmapEngine()
+    roadmap = engine.generate("Software Engineer", {}, [], confidence=0.5)
+    compact = compact_roadmap(roadmap)
+
+    assert "skill_details" not in compact["phases"][0]
+    step = compact["phases"][0]["steps"][0]
+    assert step["skill_ref"] in compact["dictionary"]["skill_details"]
+    assert len(json.dumps(compact)) * 3 < len(json.dumps(roadmap))
+
+
+def test_legacy_content_passes_through_expander():
+    legacy = [{"phase": "Phase 1 – Foundations", "steps": []}]
+
+    assert expand_roadmap(legacy, {}) is legacy
+    assert expand_roadmap(None, {}) == []
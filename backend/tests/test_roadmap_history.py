@@ -0,0 +1,110 @@
+import json
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from app.api import routes
+from app.api.auth import get_current_user_optional
+from app.core.database import Base, get_db
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.roadmap_format import compact_roadmap
+# Every model, so relationships between them resolve
+from app.models import comment, community_message, helpdesk, user  # noqa: F401
+from app.models.roadmap import Roadmap, RoadmapRevision
+from app.models.user import User
+from app.services import roadmap_history
+from app.services.roadmap_history import RoadmapConflictError, current_version, reconstruct, record_revision
+
+
+def _content(skills):
+    roadmap = RoadmapEngine().generate("Software Engineer", {"programming": 70}, skills)
+    return json.loads(json.dumps(compact_roadmap(roadmap)))
+
+
+def _sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'history.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def test_concurrent_revisions_get_distinct_versions(tmp_path):
+    Session = _sessions(tmp_path)
+    with Session() as db:
+        db.add(Roadmap(id=1, user_id=None, career_path="Software Engineer", content=_content([]), status="active"))
+        db.commit()
+
+    # Both requests load version 1 before either saves
+    first, second = Session(), Session()
+    a, b = first.get(Roadmap, 1), second.get(Roadmap, 1)
+    record_revision(first, a, _content(["git"]))
+    first.commit()
+    record_revision(second, b, _content(["git", "sql"]))
+    second.commit()
+
+    with Session() as db:
+        roadmap = db.get(Roadmap, 1)
+        assert [r.version for r in roadmap.revisions] == [1, 2]
+        assert current_version(db, roadmap) == 3
+        assert [reconstruct(db, roadmap, v) for v in (1, 2, 3)] == [_content([]), _content(["git"]), _content(["git", "sql"])]
+
+        db.add(RoadmapRevision(roadmap_id=1, version=2, patch=[]))
+        with pytest.raises(IntegrityError):
+            db.commit()
+    first.close()
+    second.close()
+
+
+def test_revision_gives_up_when_roadmap_keeps_changing(tmp_path, monkeypatch):
+    Session = _sessions(tmp_path)
+    with Session() as db:
+        db.add(Roadmap(id=1, user_id=None, career_path="Software Engineer", content=_content([]), status="active"))
+        db.commit()
+    monkeypatch.setattr(roadmap_history, "MAX_REVISION_ATTEMPTS", 1)
+
+    with Session() as stale, Session() as other:
+        roadmap = stale.get(Roadmap, 1)
+        record_revision(other, other.get(Roadmap, 1), _content(["git"]))
+        other.commit()
+
+        with pytest.raises(RoadmapConflictError):
+            record_revision(stale, roadmap, _content(["git", "sql"]))
+        stale.rollback()
+
+    with Session() as db:
+        assert current_version(db, db.get(Roadmap, 1)) == 2
+
+
+def test_predict_career_still_answers_when_roadmap_save_conflicts(tmp_path, monkeypatch):
+    Session = _sessions(tmp_path)
+    with Session() as db:
+        db.add(User(id=1, email="a@example.com", full_name="A"))
+        db.commit()
+
+    def session():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def conflict(*args):
+        raise RoadmapConflictError("Roadmap 1 changed 5 times while saving a revision")
+
+    app = FastAPI()
+    app.include_router(routes.router, prefix="/api")
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_current_user_optional] = lambda db=Depends(get_db): db.get(User, 1)
+    monkeypatch.setattr(routes, "save_roadmap", conflict)
+
+    response = TestClient(app).post("/api/predict-career", json={
+        "math_score": 80, "programming_score": 90, "communication_score": 60, "problem_solving_score": 85,
+        "interest_coding": 9, "interest_design": 3, "interest_management": 4,
+    })
+
+    assert response.status_code == 200
+    with Session() as db:
+        assert db.get(User, 1).predicted_career == response.json()["predicted_career"]
@@ -0,0 +1,70 @@
+import random
+
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.skill_matcher import AhoCorasick, StepMatcher, SubstringIndex
+from app.services.resume_parser import resume_parser
+
+
+def test_substring_index_matches_brute_force():
+    rng = random.Random(7)
+    docs = ["".join(rng.choice("ab ") for _ in range(rng.randint(1, 10))) for _ in range(6)]
+    index = SubstringIndex(docs)
+
+    for _ in range(200):
+        pattern = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 4)))
+        expected = sum(1 << i for i, doc in enumerate(docs) if pattern in doc)
+        assert index.query(pattern) == expected
+
+
+def test_aho_corasick_reports_overlapping_matches():
+    automaton = AhoCorasick([("he", "he"), ("she", "she"), ("hers", "hers"), ("his", "his")])
+
+    assert sorted(automaton.finditer("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_extract_skills_keeps_taxonomy_order():
+    text = "Led an Agile team; shipped React + Python services (machine learning, SQL). Gitlab, Dockers."
+
+    names = [skill["name"] for skill in resume_parser.extract_skills(text)]
+
+    # Whole words only: "Gitlab" is not Git, "Dockers" is not Docker
+    assert names == ["Python", "React", "SQL", "Machine Learning", "Agile"]
+
+
+def test_step_matcher_agrees_with_two_way_substring_scan():
+    engine = RoadmapEngine()
+    skills = ["python", "sql", "git", "logic", "ml", "", "data structures & algorithms", "figma pro", "x"]
+    for template in engine.TEMPLATES.values():
+        texts = [engine._step_search_text(step) for steps in template.values() for step in steps]
+        matcher = StepMatcher(texts)
+        for skill in skills:
+            expected = sum(1 << i for i, text in enumerate(texts) if skill in text or text in skill)
+            assert matcher.match([skill]) == expected
+
+
+def _scan_projects(career_projects, skills):
+    # Reference implementation: the linear scans the index replaces
+    all_projects = [p for phase_projects in career_projects.values() for p in phase_projects]
+    suggested = []
+    for skill in (s.lower() for s in skills):
+        match = next((p for p in all_projects if p not in suggested and (
+            skill in p["title"].lower()
+            or any(t.strip().lower() == skill for t in p["tech_stack"].replace("+", ",").split(",")))), None)
+        if match is None:
+            match = next((p for p in all_projects if p not in suggested and skill[:4] in p["title"].lower()), None)
+        if match is None and career_projects.get("Phase 1 – Foundations"):
+            base = career_projects["Phase 1 – Foundations"][0]
+            match = base if base not in suggested else None
+        if match is not None:
+            suggested.append(match)
+    return suggested[:3]
+
+
+def test_project_index_matches_linear_scan():
+    engine = RoadmapEngine()
+    rng = random.Random(11)
+    for career, career_projects in engine.PROJECT_TEMPLATES.items():
+        vocabulary = engine.CAREER_REQUIRED_SKILLS.get(career, []) + ["python", "react", "api", "zzzz", "sql", "figma", "data"]
+        for _ in range(50):
+            skills = rng.sample(vocabulary, rng.randint(0, 5))
+            assert engine.get_projects_for_skills(career, skills) == _scan_projects(career_projects, skills)
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from app.logic.roadmap_engine import RoadmapEngine
+from app.logic.skill_taxonomy import SkillTaxonomy, skill_taxonomy, tokenize
+from app.services.job_service import JobService
+from app.services.resume_parser import resume_parser
+
+
+def _scan_phrases(taxonomy, tokens):
+    # Reference implementation: at each position try every phrase, longest first
+    phrases = sorted(taxonomy._phrases.items(), key=lambda item: -len(item[0]))
+    found, i = [], 0
+    while i < len(tokens):
+        hit = next(((len(p), index) for p, index in phrases if tuple(tokens[i:i + len(p)]) == p), None)
+        if hit is None:
+            i += 1
+        else:
+            found.append((i, i + hit[0], hit[1]))
+            i += hit[0]
+    return found
+
+
+def test_matches_are_leftmost_longest():
+    rng = random.Random(5)
+    words = ["a", "b", "c", "d"]
+    for _ in range(300):
+        skills = [
+            {"name": " ".join(rng.choice(words) for _ in range(rng.randint(1, 3))),
+             "aliases": [" ".join(rng.choice(words) for _ in range(rng.randint(1, 3)))]}
+            for _ in range(4)
+        ]
+        taxonomy = SkillTaxonomy(skills)
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+        assert taxonomy.matches(text) == _scan_phrases(taxonomy, tokenize(text))
+
+
+def test_aliases_normalize_to_canonical_skills():
+    text = "Shipped ReactJS and Node.js apps in JS; Postgres, scikit-learn and ML pipelines. C++, not C#."
+
+    names = [skill["name"] for skill in resume_parser.extract_skills(text)]
+
+    assert names == ["JavaScript", "React", "Machine Learning", "Node.js", "C++", "PostgreSQL", "Scikit-learn"]
+    assert skill_taxonomy.normalize(["reactjs", "React", "ml", "Underwater Basket Weaving"]) == ["React", "Machine Learning", "Underwater Basket Weaving"]
+    assert skill_taxonomy.careers(["figma", "Python"]) == {"UI/UX Designer", "Data Scientist"}
+
+
+def test_everyday_words_are_not_skills():
+    text = "Built the UI for our billing app. Wrote a prototype REST service; the rest of the team used Python."
+
+    names = [skill["name"] for skill in resume_parser.extract_skills(text)]
+
+    assert names == ["Python"]
+    assert skill_taxonomy.careers(names) == {"Data Scientist"}
+    assert [s["name"] for s in resume_parser.extract_skills("UI/UX design, RESTful services")] == ["REST APIs", "UI/UX Design"]
+    # Hints only count from entries marked unambiguous
+    taxonomy = SkillTaxonomy([{"name": "Prototyping", "careers": ["UI/UX Designer"]}])
+    assert taxonomy.careers(["Prototyping"]) == set()
+
+
+def test_roadmaps_and_job_matches_accept_aliases():
+    engine = RoadmapEngine()
+    assert engine.generate("Web Developer", {}, ["ReactJS", "JS"]) == engine.generate("Web Developer", {}, ["React", "JavaScript"])
+    # The step is named after an alias ("Database" -> Databases)
+    statuses = {step["skill"]: step["status"] for phase in engine.generate("Software Engineer", {}, ["database"]) for step in phase["steps"]}
+    assert statuses["Database"] == "completed"
+
+    match = JobService.calculate_match(["reactjs", "JS", "HTML", "CSS"], ["HTML/CSS", "JavaScript", "React", "Node.js"])
+    assert match["match_percentage"] == 75.0
+    assert match["missing_skills"] == ["Node.js"]
+
+
+def test_vendor_and_branch_skills_count_towards_their_parent_only():
+    names = [s["name"] for s in resume_parser.extract_skills("Deployed on AWS, Azure and Google Cloud; calculus and linear algebra.")]
+    assert names == ["AWS", "Azure", "GCP", "Linear Algebra", "Calculus"]
+
+    # A vendor meets its parent's requirement, never a sibling's
+    assert JobService.calculate_match(["Azure"], ["AWS"])["missing_skills"] == ["AWS"]
+    assert JobService.calculate_match(["Azure"], ["Cloud Computing"])["match_percentage"] == 100.0
+    assert JobService.calculate_match(["Cloud Computing"], ["AWS"])["match_percentage"] == 0.0
+    assert skill_taxonomy.with_parents(["calculus", "Math", "gcp"]) == ["Calculus", "Math", "GCP", "Cloud Computing"]
+
+    engine = RoadmapEngine()
+
+    def completed(career, skills):
+        return [step["skill"] for phase in engine.generate(career, {}, skills) for step in phase["steps"] if step["status"] == "completed"]
+
+    assert completed("Software Engineer", ["Calculus"]) == ["Math"]
+    # "JS" is JavaScript; it no longer completes the Node.js step by substring
+    assert completed("Web Developer", ["js"]) == ["JavaScript"]
+
+    with pytest.raises(ValueError):
+        SkillTaxonomy([{"name": "AWS", "parent": "Cloud Computing"}])
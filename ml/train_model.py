@@ -1,24 +1,68 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import RandomizedSearchCV, train_test_split
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import LabelEncoder
+import argparse
 import pickle
 import os
+import sys
+import time
+import hashlib
+import json
+import re
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Versioned model registry read by backend/app/services/model_registry.py
+REGISTRY_DIR = os.path.join(ROOT_DIR, 'backend', 'app', 'models_data', 'registry')
+MODEL_FILE = 'career_model.pkl'
+FOREST_FILE = 'career_model_forest.npz'
+TABLE_FILE = 'career_model_table.npz'
+
+FEATURES = ['math_score', 'programming_score', 'communication_score', 'problem_solving_score',
+            'interest_coding', 'interest_design', 'interest_management']
+TARGET = 'career'
+
+# Prediction table grid: scores 0-100 in steps of TABLE_SCORE_STEP, every interest 0-10
+TABLE_SCORE_STEP = 10
+
+# Rows generated or read per chunk
+CHUNK_SIZE = 100_000
+
+# Bounded hyperparameter search: SEARCH_ITERATIONS candidates sampled from
+# SEARCH_SPACE, each cross-validated on at most SEARCH_MAX_ROWS training rows
+SEARCH_SPACE = {
+    'n_estimators': [50, 100, 200],
+    'max_depth': [None, 12, 16, 24],
+    'min_samples_leaf': [1, 2, 5],
+    'max_features': ['sqrt', None],
+}
+SEARCH_ITERATIONS = 8
+SEARCH_MAX_ROWS = 200_000
+SEARCH_CV = 3
+
+# Compression search (--compress): the smallest forest over this grid whose
+# accuracy is within COMPRESS_TOLERANCE of the uncompressed one and fits the
+# latency / size budgets is trained instead
+COMPRESS_TREES = [5, 10, 20, 30, 50, 100]
+COMPRESS_DEPTHS = [4, 6, 8, 10, 12, 16, None]
+COMPRESS_LEAF_SIZES = [1, 5, 20]
+COMPRESS_TOLERANCE = 0.005
 
 # Create synthetic dataset
-def create_synthetic_data(n_samples=1000):
-    np.random.seed(42)
+def create_synthetic_data(n_samples=1000, random_state=42):
+    rng = np.random.RandomState(random_state)
     
     # Features: Academic Performance (0-100), Interest Scores (0-10)
     data = {
-        'math_score': np.random.randint(50, 100, n_samples),
-        'programming_score': np.random.randint(50, 100, n_samples),
-        'communication_score': np.random.randint(50, 100, n_samples),
-        'problem_solving_score': np.random.randint(50, 100, n_samples),
-        'interest_coding': np.random.randint(1, 10, n_samples),
-        'interest_design': np.random.randint(1, 10, n_samples),
-        'interest_management': np.random.randint(1, 10, n_samples),
+        'math_score': rng.randint(50, 100, n_samples),
+        'programming_score': rng.randint(50, 100, n_samples),
+        'communication_score': rng.randint(50, 100, n_samples),
+        'problem_solving_score': rng.randint(50, 100, n_samples),
+        'interest_coding': rng.randint(1, 10, n_samples),
+        'interest_design': rng.randint(1, 10, n_samples),
+        'interest_management': rng.randint(1, 10, n_samples),
     }
     
     df = pd.DataFrame(data)
@@ -36,29 +80,470 @@ def create_synthetic_data(n_samples=1000):
     
     return df
 
-def train_model():
-    print("Generating synthetic data...")
-    df = create_synthetic_data()
-    
-    X = df.drop('career', axis=1)
-    y = df['career']
+def iter_synthetic_chunks(n_rows, chunk_size=CHUNK_SIZE, random_state=42):
+    """Synthetic rows in frames of at most chunk_size; chunk i is seeded with random_state + i."""
+    for i, start in enumerate(range(0, n_rows, chunk_size)):
+        yield create_synthetic_data(min(chunk_size, n_rows - start), random_state + i)
+
+def iter_csv_chunks(path, chunk_size=CHUNK_SIZE):
+    """Rows of a CSV with FEATURES and TARGET columns, read chunk_size at a time."""
+    return pd.read_csv(path, usecols=FEATURES + [TARGET], chunksize=chunk_size)
+
+def load_dataset(chunks):
+    """
+    Collect data chunks into one float32 feature matrix (the dtype the trees
+    split on, so fitting does not copy it again) and a label array that
+    references one string object per career, so no full-size frame is ever built.
+    """
+    features, codes, classes = [], [], {}
+    for chunk in chunks:
+        features.append(chunk[FEATURES].to_numpy(dtype=np.float32))
+        chunk_codes, uniques = pd.factorize(chunk[TARGET])
+        mapping = np.array([classes.setdefault(name, len(classes)) for name in uniques], dtype=np.int32)
+        codes.append(mapping[chunk_codes])
+    X = np.concatenate(features)
+    y = np.array(list(classes), dtype=object)[np.concatenate(codes)]
+    return X, y
+
+def search_params(X, y, n_iter=SEARCH_ITERATIONS, max_rows=SEARCH_MAX_ROWS, n_jobs=-1, random_state=42):
+    """Bounded random search over SEARCH_SPACE; returns the best parameters."""
+    if len(X) > max_rows:
+        X, _, y, _ = train_test_split(X, y, train_size=max_rows, random_state=random_state)
+    search = RandomizedSearchCV(
+        RandomForestClassifier(random_state=random_state),
+        SEARCH_SPACE, n_iter=n_iter, cv=SEARCH_CV, n_jobs=n_jobs, random_state=random_state,
+    )
+    search.fit(pd.DataFrame(X, columns=FEATURES), y)
+    print(f"Best of {n_iter} candidates on {len(X)} rows: {search.best_params_} (cv accuracy {search.best_score_:.4f})")
+    return search.best_params_
+
+def _median_ms(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return round(float(np.median(timings)) * 1000, 3)
+
+def _ml_service():
+    """The API's inference module, so latencies are measured with the evaluator that serves them."""
+    sys.path.insert(0, os.path.join(ROOT_DIR, 'backend'))
+    from app.services import ml_service
+
+    return ml_service
+
+def _flat_forest(arrays):
+    return _ml_service().FlatForest(dict(arrays, model_sha256=np.array('')))
+
+def measure_latency(clf, X, batch_size=1000):
+    """Median single-row and per-batch predict_proba latency, with sklearn and the API's flattened forest."""
+    row, batch = X[:1], X[:batch_size]
+    forest = _flat_forest(flatten_forest(clf.estimators_, clf.classes_))
+    flat_batch = batch[:_ml_service().FLAT_FOREST_MAX_ROWS]
+    return {
+        'batch_size': len(batch),
+        'sklearn_single_row_ms': _median_ms(lambda: clf.predict_proba(pd.DataFrame(row, columns=FEATURES)), 50),
+        'sklearn_batch_ms': _median_ms(lambda: clf.predict_proba(pd.DataFrame(batch, columns=FEATURES)), 5),
+        'flat_single_row_ms': _median_ms(lambda: forest.predict_proba(row), 200),
+        'flat_batch_ms': _median_ms(lambda: forest.predict_proba(flat_batch), 20),
+        'flat_batch_size': len(flat_batch),
+    }
+
+def _forest_bytes(node_count, n_classes):
+    # feature, left, right (int32), threshold and one float64 per class
+    return node_count * (3 * 4 + 8 + 8 * n_classes)
+
+def compress_model(X, y, params, max_latency_ms=None, max_size_mb=None, tolerance=COMPRESS_TOLERANCE, max_rows=SEARCH_MAX_ROWS, n_jobs=-1, random_state=42):
+    """
+    Find the smallest forest whose validation accuracy is within `tolerance`
+    of a forest trained with `params`, and whose flattened size and
+    single-row latency (with the API's evaluator) fit the budgets.
+
+    One forest of max(COMPRESS_TREES) trees is fitted per (max_depth,
+    min_samples_leaf) pair; a forest of k trees with the same random_state
+    is exactly its first k trees, so every tree count is scored from that
+    one fit. Returns (chosen params or None, baseline point, curve).
+    """
+    X_fit, X_val, y_fit, y_val = train_test_split(X, y, test_size=0.2, random_state=random_state)
+    if len(X_fit) > max_rows:
+        X_fit, _, y_fit, _ = train_test_split(X_fit, y_fit, train_size=max_rows, random_state=random_state)
+        X_val, y_val = X_val[:max_rows // 4], y_val[:max_rows // 4]
+    row = X_val[:1]
+
+    def evaluate(clf, n_trees):
+        estimators = clf.estimators_[:n_trees]
+        proba = sum(e.predict_proba(X_val) for e in estimators)
+        node_count = sum(e.tree_.node_count for e in estimators)
+        forest = _flat_forest(flatten_forest(estimators, clf.classes_))
+        return {
+            'n_estimators': n_trees,
+            'max_depth': clf.max_depth,
+            'min_samples_leaf': clf.min_samples_leaf,
+            'accuracy': round(float(np.mean(clf.classes_[proba.argmax(axis=1)] == y_val)), 4),
+            'nodes': int(node_count),
+            'size_mb': round(_forest_bytes(node_count, len(clf.classes_)) / 1e6, 3),
+            'single_row_ms': _median_ms(lambda: forest.predict_proba(row), 100),
+        }
+
+    def fit(**overrides):
+        return RandomForestClassifier(**dict(params, random_state=random_state, n_jobs=n_jobs, **overrides)).fit(X_fit, y_fit)
+
+    baseline_clf = fit()
+    baseline = evaluate(baseline_clf, baseline_clf.n_estimators)
+    print(f"Baseline: accuracy {baseline['accuracy']}, {baseline['nodes']} nodes, {baseline['size_mb']} MB, {baseline['single_row_ms']} ms per row")
+
+    curve = []
+    for max_depth in COMPRESS_DEPTHS:
+        for min_samples_leaf in COMPRESS_LEAF_SIZES:
+            clf = fit(n_estimators=max(COMPRESS_TREES), max_depth=max_depth, min_samples_leaf=min_samples_leaf)
+            curve.extend(evaluate(clf, n_trees) for n_trees in COMPRESS_TREES)
+
+    for point in curve:
+        point['eligible'] = (
+            point['accuracy'] >= baseline['accuracy'] - tolerance
+            and (max_latency_ms is None or point['single_row_ms'] <= max_latency_ms)
+            and (max_size_mb is None or point['size_mb'] <= max_size_mb)
+        )
+    eligible = [point for point in curve if point['eligible']]
+    if not eligible:
+        print("No candidate meets the accuracy tolerance and budgets; keeping the baseline parameters")
+        return None, baseline, curve
+    best = min(eligible, key=lambda point: (point['nodes'], -point['accuracy']))
+    print(f"Chosen: {best}")
+    chosen = dict(params, **{name: best[name] for name in ('n_estimators', 'max_depth', 'min_samples_leaf')})
+    return chosen, baseline, curve
+
+def pareto_front(curve):
+    """Points of the size/accuracy curve that no smaller candidate matches or beats on accuracy."""
+    front, best_accuracy = [], -1.0
+    for point in sorted(curve, key=lambda point: (point['nodes'], -point['accuracy'])):
+        if point['accuracy'] > best_accuracy:
+            front.append(point)
+            best_accuracy = point['accuracy']
+    return front
+
+def train_model(chunks, n_jobs=-1, search_iterations=SEARCH_ITERATIONS, search_rows=SEARCH_MAX_ROWS, activate=False, registry_dir=REGISTRY_DIR, compress=None):
+    """
+    Train, export and register a model. `compress` is None or a dict of
+    compress_model() budgets (max_latency_ms, max_size_mb, tolerance).
+    """
+    started = time.perf_counter()
+    print("Loading data...")
+    X, y = load_dataset(chunks)
+    print(f"{len(X)} rows, {X.nbytes / 1e6:.1f} MB of features")
     
     # Train test split
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    del X, y
+    
+    params = {'n_estimators': 100}
+    if search_iterations > 0:
+        print("Searching hyperparameters...")
+        params = search_params(X_train, y_train, search_iterations, search_rows, n_jobs)
+    
+    compression = None
+    if compress is not None:
+        print("Searching for a smaller model...")
+        chosen, baseline, curve = compress_model(X_train, y_train, params, max_rows=search_rows, n_jobs=n_jobs, **compress)
+        compression = dict(compress, baseline=baseline, chosen=chosen, candidates=len(curve))
+        params = chosen or params
     
     # Train Model
-    print("Training Random Forest model...")
-    clf = RandomForestClassifier(n_estimators=100, random_state=42)
-    clf.fit(X_train, y_train)
+    print(f"Training Random Forest model ({params})...")
+    fit_started = time.perf_counter()
+    clf = RandomForestClassifier(**params, random_state=42, n_jobs=n_jobs)
+    clf.fit(pd.DataFrame(X_train, columns=FEATURES), y_train)
+    fit_seconds = time.perf_counter() - fit_started
+    
+    accuracy = clf.score(pd.DataFrame(X_test, columns=FEATURES), y_test)
+    print(f"Model Accuracy: {accuracy:.2f}")
+    if compression is not None and accuracy < compression['baseline']['accuracy'] - compression['tolerance']:
+        print(f"Warning: test accuracy {accuracy:.4f} is more than {compression['tolerance']} below the baseline; try a smaller --accuracy-tolerance")
     
-    print(f"Model Accuracy: {clf.score(X_test, y_test):.2f}")
+    # The API scores rows in its own process and batches; never fan out per request
+    clf.set_params(n_jobs=None)
     
-    # Save Model
-    os.makedirs('backend/app/models_data', exist_ok=True)
-    with open('backend/app/models_data/career_model.pkl', 'wb') as f:
+    # Save Model as a new registry version
+    version_dir = new_version_dir(registry_dir)
+    model_path = os.path.join(version_dir, MODEL_FILE)
+    with open(model_path, 'wb') as f:
         pickle.dump(clf, f)
     
-    print("Model saved to backend/app/models_data/career_model.pkl")
+    print(f"Model saved to {model_path}")
+    forest_path = os.path.join(version_dir, FOREST_FILE)
+    export_forest(clf, model_path, forest_path)
+    clf.set_params(n_jobs=n_jobs)
+    build_prediction_table(clf, model_path, os.path.join(version_dir, TABLE_FILE))
+    clf.set_params(n_jobs=None)
+
+    card = {
+        'train_rows': len(X_train),
+        'test_rows': len(X_test),
+        'fit_seconds': round(fit_seconds, 2),
+        'total_seconds': round(time.perf_counter() - started, 2),
+        'search_iterations': search_iterations,
+        'model_bytes': os.path.getsize(model_path),
+        'forest_bytes': os.path.getsize(forest_path),
+        'node_count': int(sum(e.tree_.node_count for e in clf.estimators_)),
+        'latency': measure_latency(clf, X_test),
+    }
+    if compression is not None:
+        card['compression'] = compression
+        write_tradeoff(curve, os.path.join(version_dir, 'tradeoff.csv'))
+        card['tradeoff'] = pareto_front(curve)
+    write_metadata(clf, version_dir, accuracy, card=card)
+
+    version = os.path.basename(version_dir)
+    if activate or current_version(registry_dir) is None:
+        set_current(version, registry_dir)
+        print(f"Activated model {version}")
+    else:
+        print(f"Registered model {version}; activate it with POST /api/admin/models/{version}/activate or --activate")
+    return version
+
+def new_version_dir(registry_dir=REGISTRY_DIR):
+    """Create the next registry version directory (v1, v2, ...)."""
+    os.makedirs(registry_dir, exist_ok=True)
+    numbers = [int(m.group(1)) for m in (re.match(r'^v(\d+)$', entry) for entry in os.listdir(registry_dir)) if m]
+    path = os.path.join(registry_dir, f"v{max(numbers, default=0) + 1}")
+    os.makedirs(path)
+    return path
+
+def write_metadata(clf, version_dir, accuracy, trained_at=None, card=None):
+    """Write metadata.json and, when training statistics are given, a readable model_card.md."""
+    metadata = {
+        'version': os.path.basename(version_dir),
+        'trained_at': trained_at or datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'accuracy': round(float(accuracy), 4),
+        'features': list(clf.feature_names_in_),
+        'classes': list(clf.classes_),
+        'model_sha256': _model_sha256(os.path.join(version_dir, MODEL_FILE)),
+        'params': {name: clf.get_params()[name] for name in ('n_estimators', 'max_depth', 'min_samples_leaf', 'max_features', 'random_state')},
+    }
+    if card:
+        metadata['card'] = card
+    with open(os.path.join(version_dir, 'metadata.json'), 'w') as f:
+        json.dump(metadata, f, indent=2)
+        f.write('\n')
+    if card:
+        with open(os.path.join(version_dir, 'model_card.md'), 'w') as f:
+            f.write(render_model_card(metadata))
+
+def render_model_card(metadata):
+    card, latency = metadata['card'], metadata['card']['latency']
+    return '\n'.join([
+        f"# Career model {metadata['version']}",
+        '',
+        f"Trained {metadata['trained_at']} on {card['train_rows']:,} rows "
+        f"({card['fit_seconds']} s fit, {card['total_seconds']} s end to end, "
+        f"{card['search_iterations']} search candidates).",
+        '',
+        '| | |',
+        '|---|---|',
+        f"| Test accuracy | {metadata['accuracy']:.4f} ({card['test_rows']:,} rows) |",
+        f"| Parameters | {', '.join(f'{k}={v}' for k, v in metadata['params'].items())} |",
+        f"| Nodes | {card['node_count']:,} |",
+        f"| Pickle size | {card['model_bytes'] / 1e6:.2f} MB |",
+        f"| Flattened forest size | {card['forest_bytes'] / 1e6:.2f} MB |",
+        f"| Single row, flattened forest | {latency['flat_single_row_ms']} ms |",
+        f"| {latency['flat_batch_size']} rows, flattened forest | {latency['flat_batch_ms']} ms |",
+        f"| Single row, sklearn | {latency['sklearn_single_row_ms']} ms |",
+        f"| {latency['batch_size']} rows, sklearn | {latency['sklearn_batch_ms']} ms |",
+        '',
+        f"Features: {', '.join(metadata['features'])}",
+        '',
+        f"Classes: {', '.join(metadata['classes'])}",
+        '',
+    ] + (render_tradeoff(card) if 'compression' in card else []))
+
+def render_tradeoff(card):
+    compression, baseline = card['compression'], card['compression']['baseline']
+    budgets = [
+        f"accuracy within {compression['tolerance']} of the baseline",
+        f"single row <= {compression['max_latency_ms']} ms" if compression['max_latency_ms'] is not None else None,
+        f"forest <= {compression['max_size_mb']} MB" if compression['max_size_mb'] is not None else None,
+    ]
+    lines = [
+        '## Compression',
+        '',
+        f"Budget: {', '.join(b for b in budgets if b)}. "
+        f"Baseline ({baseline['n_estimators']} trees, max_depth={baseline['max_depth']}): validation accuracy "
+        f"{baseline['accuracy']}, {baseline['nodes']:,} nodes, {baseline['size_mb']} MB, {baseline['single_row_ms']} ms per row. "
+        + ("No candidate fit the budget; the baseline parameters were kept." if compression['chosen'] is None else
+           f"Chosen: {compression['chosen']}."),
+        '',
+        f"Smallest candidates at each accuracy level ({compression['candidates']} candidates in tradeoff.csv):",
+        '',
+        '| Trees | Max depth | Min leaf | Validation accuracy | Nodes | Forest MB | Single row ms | In budget |',
+        '|---|---|---|---|---|---|---|---|',
+    ]
+    lines += [
+        f"| {p['n_estimators']} | {p['max_depth']} | {p['min_samples_leaf']} | {p['accuracy']} | {p['nodes']:,} | {p['size_mb']} | {p['single_row_ms']} | {'yes' if p['eligible'] else 'no'} |"
+        for p in card['tradeoff']
+    ]
+    return lines + ['']
+
+def write_tradeoff(curve, path):
+    """Every compression candidate, smallest first."""
+    pd.DataFrame(sorted(curve, key=lambda point: point['nodes'])).to_csv(path, index=False)
+    print(f"Tradeoff curve ({len(curve)} candidates) saved to {path}")
+
+def current_version(registry_dir=REGISTRY_DIR):
+    try:
+        with open(os.path.join(registry_dir, 'CURRENT')) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def set_current(version, registry_dir=REGISTRY_DIR):
+    tmp_path = os.path.join(registry_dir, 'CURRENT.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(version + '\n')
+    os.replace(tmp_path, os.path.join(registry_dir, 'CURRENT'))
+
+def _model_sha256(model_path):
+    with open(model_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def flatten_forest(estimators, classes):
+    """
+    Flatten fitted trees into packed arrays for the NumPy evaluator in
+    ml_service: all trees share one node numbering, `root` holds each tree's
+    first node, and leaves point to themselves (threshold +inf) so every row
+    can be walked a fixed `max_depth` steps. `value` holds normalized class
+    distributions, as used by predict_proba. `children` interleaves right and
+    left child (children[2 * node + went_left]) so a step is one gather from
+    the memory-mapped export.
+    """
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in estimators:
+        tree = estimator.tree_
+        nodes = np.arange(tree.node_count)
+        is_leaf = tree.children_left == -1
+
+        roots.append(offset)
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        lefts.append(np.where(is_leaf, nodes, tree.children_left) + offset)
+        rights.append(np.where(is_leaf, nodes, tree.children_right) + offset)
+
+        value = tree.value[:, 0, :]
+        normalizer = value.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        values.append(value / normalizer)
+        offset += tree.node_count
+
+    children = np.stack([np.concatenate(rights), np.concatenate(lefts)], axis=1).ravel()
+    return {
+        'feature': np.concatenate(features).astype(np.int32),
+        'threshold': np.concatenate(thresholds).astype(np.float64),
+        'children': children.astype(np.int32),
+        'value': np.concatenate(values).astype(np.float64),
+        'root': np.array(roots, dtype=np.int32),
+        'classes': np.array(classes, dtype=str),
+        'max_depth': np.array(max(e.tree_.max_depth for e in estimators)),
+    }
+
+def export_forest(clf, model_path, path):
+    """Save flatten_forest(clf) next to the pickle it came from."""
+    arrays = flatten_forest(clf.estimators_, clf.classes_)
+    # Ties the export to the exact pickle it came from
+    np.savez(path, model_sha256=np.array(_model_sha256(model_path)), **arrays)
+    print(f"Flattened forest ({len(arrays['feature'])} nodes) saved to {path}")
+
+def build_prediction_table(clf, model_path, path, score_step=TABLE_SCORE_STEP):
+    """
+    Precompute predict_proba over a grid of inputs for CareerPredictor's lookup table.
+
+    The forest only sees which side of each split threshold a feature falls on,
+    so every input in the same threshold interval ("bin") on all seven features
+    gets exactly the same prediction. The table is keyed by bins: any input
+    whose bins all contain a grid value is a hit, even if it is not itself on the grid.
+    """
+    n_features = clf.n_features_in_
+    grids = [
+        range(0, 11) if name.startswith('interest_') else range(0, 101, score_step)
+        for name in clf.feature_names_in_
+    ]
+
+    arrays = {}
+    representatives = []
+    for i, grid in enumerate(grids):
+        thresholds = np.unique(np.concatenate([
+            e.tree_.threshold[(e.tree_.children_left != -1) & (e.tree_.feature == i)] for e in clf.estimators_
+        ]))
+        # bin = number of thresholds strictly below the (float32) value, as in the trees
+        bins = np.searchsorted(thresholds, np.asarray(list(grid), dtype=np.float32).astype(np.float64), side='left')
+        bin_to_grid = np.full(len(thresholds) + 1, -1, dtype=np.int32)
+        values = []
+        for value, b in zip(grid, bins):
+            if bin_to_grid[b] < 0:
+                bin_to_grid[b] = len(values)
+                values.append(value)
+        arrays[f'thresholds_{i}'] = thresholds
+        arrays[f'bin_to_grid_{i}'] = bin_to_grid
+        representatives.append(values)
+
+    sizes = [len(v) for v in representatives]
+    strides = np.cumprod([1] + sizes[:0:-1])[::-1]
+    points = np.stack(np.meshgrid(*[np.asarray(v, dtype=np.float64) for v in representatives], indexing='ij'), axis=-1).reshape(-1, n_features)
+
+    probabilities = np.concatenate([
+        clf.predict_proba(pd.DataFrame(points[start:start + 100_000], columns=clf.feature_names_in_))
+        for start in range(0, len(points), 100_000)
+    ])
+    # Many grid points share a distribution; store each once
+    unique, index = np.unique(probabilities, axis=0, return_inverse=True)
+
+    np.savez_compressed(
+        path,
+        strides=np.asarray(strides, dtype=np.int64),
+        index=index.reshape(-1).astype(np.uint32),
+        probabilities=unique,
+        classes=np.array(clf.classes_, dtype=str),
+        model_sha256=np.array(_model_sha256(model_path)),
+        **arrays,
+    )
+    print(f"Prediction table ({len(points)} grid points, {len(unique)} distinct predictions) saved to {path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train a career model and register it as a new version.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--rows', type=int, default=1000, help="synthetic rows to generate (default: 1000)")
+    source.add_argument('--data', help="CSV with the feature columns and 'career', read in chunks")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--n-jobs', type=int, default=-1, help="cores for search and fitting (default: all)")
+    parser.add_argument('--search-iterations', type=int, default=SEARCH_ITERATIONS, help="0 skips the search")
+    parser.add_argument('--search-rows', type=int, default=SEARCH_MAX_ROWS)
+    parser.add_argument('--compress', action='store_true', help="train the smallest model within the accuracy tolerance and budgets")
+    parser.add_argument('--max-latency-ms', type=float, help="single-row latency budget for --compress")
+    parser.add_argument('--max-size-mb', type=float, help="flattened forest size budget for --compress")
+    parser.add_argument('--accuracy-tolerance', type=float, default=COMPRESS_TOLERANCE, help=f"accuracy --compress may give up (default: {COMPRESS_TOLERANCE})")
+    parser.add_argument('--registry', default=REGISTRY_DIR)
+    parser.add_argument('--activate', action='store_true', help="serve the new version right away")
+    parser.add_argument('--export-only', action='store_true', help="re-export the active model without retraining")
+    args = parser.parse_args(argv)
+
+    if args.export_only:
+        version_dir = os.path.join(args.registry, current_version(args.registry) or '')
+        model_path = os.path.join(version_dir, MODEL_FILE)
+        with open(model_path, 'rb') as f:
+            clf = pickle.load(f)
+        export_forest(clf, model_path, os.path.join(version_dir, FOREST_FILE))
+        build_prediction_table(clf, model_path, os.path.join(version_dir, TABLE_FILE))
+        return
+
+    if args.data:
+        chunks = iter_csv_chunks(args.data, args.chunk_size)
+    else:
+        print("Generating synthetic data...")
+        chunks = iter_synthetic_chunks(args.rows, args.chunk_size)
+    compress = None
+    if args.compress or args.max_latency_ms is not None or args.max_size_mb is not None:
+        compress = {'max_latency_ms': args.max_latency_ms, 'max_size_mb': args.max_size_mb, 'tolerance': args.accuracy_tolerance}
+    train_model(chunks, args.n_jobs, args.search_iterations, args.search_rows, args.activate, args.registry, compress)
 
 if __name__ == "__main__":
-    train_model()
+    main()